@@ -1,9 +1,48 @@
 """Configuration management for Mo Commander."""
 
+import atexit
 import json
 import os
+import threading
+from collections import ChainMap
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, Set
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
+# Keep Windows from translating newlines on the raw file descriptor
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# Linux 3.11+: create an unnamed file that only appears once it is linked
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+
+
+def _write_all(fd: int, buf: bytes) -> None:
+    """Write the whole buffer to fd."""
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes into config data."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Serialized form of a config with no user overrides, computed once
+_EMPTY_JSON_BYTES = _dumps({})
 
 
 class Config:
@@ -17,46 +56,163 @@ class Config:
         "confirm_operations": True,
         "editor": "notepad.exe",
         "sort_order": "name_asc",
+        "preserve_full_metadata": False,
     }
 
+    # Coalescing window for writes triggered by set()
+    SAVE_DELAY = 0.2
+
     def __init__(self):
         self.config_dir = Path.home() / ".mocommander"
         self.config_file = self.config_dir / "config.json"
-        self._config: Dict[str, Any] = {}
-        self.load()
+        # User overrides layered over DEFAULT_CONFIG; only maps[0] is saved.
+        # Loaded on first access so unused instances never touch the disk.
+        self._config: Optional[ChainMap[str, Any]] = None
+        # Keys changed since the last successful save
+        self._dirty_keys: Set[str] = set()
+        self._batching = False
+        self._save_timer: Optional[threading.Timer] = None
+        # Guards the data and _dirty_keys; _save_lock keeps writes in order
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        atexit.register(self.flush)
 
     def load(self) -> None:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, "r") as f:
-                    self._config = {**self.DEFAULT_CONFIG, **json.load(f)}
-            except (json.JSONDecodeError, IOError):
-                self._config = self.DEFAULT_CONFIG.copy()
+                self._config = ChainMap(_loads(self.config_file.read_bytes()), self.DEFAULT_CONFIG)
+            except (ValueError, IOError):
+                self._config = ChainMap({}, self.DEFAULT_CONFIG)
         else:
-            self._config = self.DEFAULT_CONFIG.copy()
+            self._config = ChainMap({}, self.DEFAULT_CONFIG)
+
+    def _loaded(self) -> "ChainMap[str, Any]":
+        """Return the config data, reading the file on first use."""
+        if self._config is None:
+            self.load()
+        return self._config
 
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file.
+
+        Nothing is written when no key changed and the file already exists.
+        """
+        user_config = self._loaded().maps[0]
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty_keys and self.config_file.exists():
+                    return
+                # Take the pending keys before serializing, so a set() that
+                # lands during the write stays dirty for the next save
+                saving, self._dirty_keys = self._dirty_keys, set()
+                snapshot = dict(user_config)
+            try:
+                self._write(_dumps(snapshot) if snapshot else _EMPTY_JSON_BYTES)
+            except IOError:
+                with self._lock:
+                    self._dirty_keys |= saving
+
+    def _write(self, buf: bytes) -> None:
+        """Write serialized config to the file."""
+        # Created on first save, and again if it was removed since
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.config_file.with_suffix(".json.tmp")
+        # Write the whole buffer to a temp file and swap it in, so a crash
+        # mid-write never leaves a truncated config behind.
+        if not (_O_TMPFILE and self._save_via_tmpfile(buf, tmp_file)):
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+            try:
+                _write_all(fd, buf)
+            finally:
+                os.close(fd)
+        os.replace(tmp_file, self.config_file)
+
+    def _save_via_tmpfile(self, buf: bytes, tmp_file: Path) -> bool:
+        """Write buf to an O_TMPFILE inode and link it in as tmp_file.
+
+        The file has no name until it is fully written, so a crash while
+        writing leaves nothing behind. Returns False when the kernel or
+        filesystem doesn't support it.
+        """
+        try:
+            dir_fd = os.open(self.config_dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return False
+        try:
+            fd = os.open(".", _O_TMPFILE | os.O_WRONLY, 0o644, dir_fd=dir_fd)
+        except OSError:
+            os.close(dir_fd)
+            return False
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self._config, f, indent=2)
-        except IOError:
-            pass
+            _write_all(fd, buf)
+            try:
+                os.unlink(tmp_file.name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+            # Passing dst_dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW),
+            # which resolves the /proc magic link to the unnamed inode. It
+            # can't replace an existing file, hence the rename in save().
+            os.link(f"/proc/self/fd/{fd}", tmp_file.name, dst_dir_fd=dir_fd)
+            return True
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+            os.close(dir_fd)
 
     def get(self, key: str, default=None) -> Any:
         """Get configuration value."""
-        return self._config.get(key, default)
+        return self._loaded().get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set configuration value."""
-        self._config[key] = value
+        """Set configuration value.
+
+        The write is deferred so that a burst of set() calls results in a
+        single save; use flush() to persist immediately.
+        """
+        user_config = self._loaded().maps[0]
+        with self._lock:
+            if key in user_config and user_config[key] == value:
+                return
+            user_config[key] = value
+            self._dirty_keys.add(key)
+        if not self._batching:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """(Re)arm the debounced save timer."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty_keys:
+                return
         self.save()
 
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """Group several set() calls into a single save."""
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            if self._dirty_keys:
+                self.flush()
+
     def get_theme(self) -> str:
         """Get current theme name."""
-        return self._config.get("theme", "retro")
+        return self._loaded().get("theme", "retro")
 
     def set_theme(self, theme: str) -> None:
         """Set current theme."""
@@ -64,8 +220,8 @@ class Config:
 
     def get_left_panel_path(self) -> str:
         """Get left panel path."""
-        return self._config.get("left_panel_path") or os.getcwd()
+        return self._loaded().get("left_panel_path") or os.getcwd()
 
     def get_right_panel_path(self) -> str:
         """Get right panel path."""
-        return self._config.get("right_panel_path") or os.getcwd()
+        return self._loaded().get("right_panel_path") or os.getcwd()
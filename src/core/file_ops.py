@@ -1,77 +1,385 @@
 """File operations for Mo Commander."""
 
+import errno
 import os
 import shutil
+import stat
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+_IS_LINUX = sys.platform.startswith("linux")
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# Lets a FIFO be opened without waiting for a writer; no effect on regular files
+_O_NONBLOCK = getattr(os, "O_NONBLOCK", 0)
+_COPY_CHUNK = 1 << 30
+# Step size when a caller reports progress
+_PROGRESS_CHUNK = 1 << 20
+_USERSPACE_CHUNK = 1 << 20
+# Whether directories can be walked and emptied relative to an open fd
+_HAVE_FD_FUNCS = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+
+def _open_dir_fd(path) -> Optional[int]:
+    """Open a directory for *at() calls, or return None where unsupported."""
+    if not _HAVE_FD_FUNCS:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY | os.O_DIRECTORY | _O_CLOEXEC)
+    except OSError:
+        return None
+
+
+class FileInfo(NamedTuple):
+    """Metadata for a single file or directory."""
+
+    name: str
+    size: int
+    is_dir: bool
+    modified: float
+    created: float
+
+
+def _iter_copy_fds(src_fd: int, dst_fd: int, chunk: int) -> Iterator[int]:
+    """Copy the rest of src_fd into dst_fd, yielding bytes written per chunk.
+
+    Tries copy_file_range (which can reflink on Btrfs/XFS), then sendfile,
+    then a plain userspace copy. Each step continues from the current file
+    offsets, so a fallback after a partial copy is safe.
+    """
+    # Pseudo-files (procfs, sysfs) report EOF to the in-kernel copies on the
+    # first call, so a zero-byte first result falls through to the next method
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, chunk)
+                if not n:
+                    break
+                copied = True
+                yield n
+        except OSError:
+            pass
+        else:
+            if copied:
+                return
+    if _IS_LINUX:
+        try:
+            while True:
+                n = os.sendfile(dst_fd, src_fd, None, chunk)
+                if not n:
+                    break
+                copied = True
+                yield n
+        except OSError:
+            pass
+        else:
+            if copied:
+                return
+    buf_size = min(chunk, _USERSPACE_CHUNK)
+    while True:
+        data = os.read(src_fd, buf_size)
+        if not data:
+            return
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view):]
+        yield len(data)
+
+
+def _special_file_error(path, mode: int) -> shutil.SpecialFileError:
+    """Build the error for a FIFO, socket or device met during a copy."""
+    if stat.S_ISFIFO(mode):
+        return shutil.SpecialFileError(f"`{path}` is a named pipe")
+    return shutil.SpecialFileError(f"`{path}` is not a regular file")
+
+
+def _copy_times(src_st: os.stat_result, dst, dst_fd: Optional[int] = None) -> None:
+    """Copy permission bits and timestamps only (no xattrs or flags)."""
+    mode = stat.S_IMODE(src_st.st_mode)
+    times = (src_st.st_atime_ns, src_st.st_mtime_ns)
+    if dst_fd is not None and hasattr(os, "fchmod") and os.utime in os.supports_fd:
+        os.fchmod(dst_fd, mode)
+        os.utime(dst_fd, ns=times)
+    else:
+        os.chmod(dst, mode)
+        os.utime(dst, ns=times)
+
+
+def _iter_copy_regular_file(src, dst, chunk: int, full_metadata: bool,
+                            dst_dir_fd: Optional[int] = None) -> Iterator[int]:
+    """Copy a single file with its permissions and timestamps.
+
+    With full_metadata the copy behaves like shutil.copy2 (including
+    extended attributes); otherwise only mode and times are carried over.
+    If dst_dir_fd is given, dst is created relative to that open directory.
+    """
+    src_fd = os.open(src, os.O_RDONLY | _O_CLOEXEC | _O_BINARY | _O_NONBLOCK)
+    try:
+        src_st = os.fstat(src_fd)
+        if stat.S_ISDIR(src_st.st_mode):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(src))
+        if not stat.S_ISREG(src_st.st_mode):
+            raise _special_file_error(src, src_st.st_mode)
+        flags = os.O_WRONLY | os.O_CREAT | _O_CLOEXEC | _O_BINARY
+        if dst_dir_fd is not None:
+            dst_fd = os.open(os.path.basename(dst), flags, 0o666, dir_fd=dst_dir_fd)
+        else:
+            dst_fd = os.open(dst, flags, 0o666)
+        try:
+            # Check before truncating so copying a file onto itself is harmless
+            dst_st = os.fstat(dst_fd)
+            if (dst_st.st_dev, dst_st.st_ino) == (src_st.st_dev, src_st.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+            os.ftruncate(dst_fd, 0)
+            yield from _iter_copy_fds(src_fd, dst_fd, chunk)
+            if not full_metadata:
+                _copy_times(src_st, dst, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    if full_metadata:
+        shutil.copystat(src, dst)
+
+
+def _iter_copy_tree(src, dst, chunk: int, full_metadata: bool) -> Iterator[int]:
+    """Copy a directory tree, yielding the size of each file once copied."""
+    # List src before creating dst, so a dst inside src is never listed
+    with os.scandir(src) as it:
+        entries = list(it)
+    os.makedirs(dst, exist_ok=True)
+    for entry in entries:
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            yield from _iter_copy_tree(entry.path, target, chunk, full_metadata)
+        else:
+            yield sum(_iter_copy_regular_file(entry.path, target, chunk, full_metadata))
+    if full_metadata:
+        shutil.copystat(src, dst)
+    else:
+        _copy_times(os.stat(src), dst)
+
+
+def _check_not_into_itself(src, dst) -> None:
+    """Refuse to copy a directory to itself or into its own subtree."""
+    src_real = os.path.realpath(src)
+    dst_real = os.path.realpath(dst)
+    if dst_real == src_real or dst_real.startswith(src_real.rstrip(os.sep) + os.sep):
+        raise shutil.Error(f"Cannot copy a directory, {os.fspath(src)!r}, into itself, {os.fspath(dst)!r}")
+
+
+def _iter_copy_path(src, dst, chunk: int, full_metadata: bool,
+                    dst_dir_fd: Optional[int] = None) -> Iterator[int]:
+    """Copy a file or directory tree from src to dst."""
+    # Try the common file case first; opening a directory fails fast
+    try:
+        yield from _iter_copy_regular_file(src, dst, chunk, full_metadata, dst_dir_fd)
+    except IsADirectoryError:
+        _check_not_into_itself(src, dst)
+        yield from _iter_copy_tree(src, dst, chunk, full_metadata)
+    except PermissionError:
+        # Windows reports a directory as access denied, not EISDIR
+        if not os.path.isdir(src):
+            raise
+        _check_not_into_itself(src, dst)
+        yield from _iter_copy_tree(src, dst, chunk, full_metadata)
+
+
+def _move_path(src, dst, dst_dir_fd: Optional[int] = None) -> None:
+    """Move src to dst, renaming relative to dst_dir_fd when possible."""
+    if dst_dir_fd is not None:
+        try:
+            os.rename(src, os.path.basename(dst), dst_dir_fd=dst_dir_fd)
+            return
+        except OSError:
+            # Cross-device moves and existing destination dirs are left to
+            # shutil.move, which also raises the real error if any
+            pass
+    shutil.move(os.fspath(src), os.fspath(dst))
+
+
+def _rmtree_fd(dir_fd: int) -> None:
+    """Empty the directory open as dir_fd.
+
+    Entries are removed with unlinkat/rmdirat relative to the open
+    directory, and their type comes from the readdir d_type, so the
+    kernel never re-walks the full path.
+    """
+    with os.scandir(dir_fd) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW | _O_CLOEXEC,
+                         dir_fd=dir_fd)
+            try:
+                _rmtree_fd(fd)
+            finally:
+                os.close(fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
+        else:
+            os.unlink(entry.name, dir_fd=dir_fd)
 
 
 class FileOperations:
-    """File operations handler."""
+    """File operations handler.
+
+    Operations raise OSError (with the original errno) on failure, so
+    callers can tell e.g. PermissionError from FileNotFoundError.
+    """
 
     @staticmethod
-    def copy_file(src: Path, dst: Path) -> bool:
+    def copy_file(src: Path, dst: Path, preserve_full_metadata: bool = False) -> None:
         """Copy a file from src to dst."""
+        for _ in FileOperations.copy_file_iter(src, dst, chunk=_COPY_CHUNK,
+                                               preserve_full_metadata=preserve_full_metadata):
+            pass
+
+    @staticmethod
+    def copy_file_iter(src: Path, dst: Path, chunk: int = _PROGRESS_CHUNK,
+                       preserve_full_metadata: bool = False) -> Iterator[int]:
+        """Copy a file or directory, yielding the number of bytes copied per step.
+
+        Files report progress every chunk, directory trees once per file, so
+        a UI can pump the iterator between redraws. Errors are raised.
+        Permissions and timestamps are always kept; extended attributes and
+        flags only with preserve_full_metadata.
+        """
+        yield from _iter_copy_path(src, dst, chunk, preserve_full_metadata)
+
+    @staticmethod
+    def copy_into(sources: Iterable[Path], dst_dir: Path,
+                  preserve_full_metadata: bool = False,
+                  progress: Optional[Callable[[int], None]] = None) -> list[tuple[Path, Path, bool]]:
+        """Copy files and directories into dst_dir, keeping their names.
+
+        The destination directory is opened once and files are created
+        relative to it. Returns (src, dst, ok) per source; a failure does
+        not stop the rest of the batch. progress, if given, is called with
+        the bytes copied per step, as copy_file_iter yields them.
+        """
+        results = []
+        dst_dir_s = os.fspath(dst_dir)
+        dir_fd = _open_dir_fd(dst_dir_s)
         try:
-            if src.is_dir():
-                shutil.copytree(src, dst, dirs_exist_ok=True)
-            else:
-                shutil.copy2(src, dst)
-            return True
-        except Exception:
-            return False
+            for src in sources:
+                # Work on plain strings; only the undo record needs a Path
+                dst_s = os.path.join(dst_dir_s, src.name)
+                try:
+                    chunk = _PROGRESS_CHUNK if progress else _COPY_CHUNK
+                    for n in _iter_copy_path(src, dst_s, chunk, preserve_full_metadata, dir_fd):
+                        if progress:
+                            progress(n)
+                    ok = True
+                except OSError:
+                    ok = False
+                results.append((src, Path(dst_s), ok))
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        return results
 
     @staticmethod
-    def move_file(src: Path, dst: Path) -> bool:
+    def move_file(src: Path, dst: Path) -> None:
         """Move a file from src to dst."""
+        shutil.move(str(src), str(dst))
+
+    @staticmethod
+    def move_into(sources: Iterable[Path], dst_dir: Path) -> list[tuple[Path, Path, bool]]:
+        """Move files and directories into dst_dir, keeping their names.
+
+        Same-filesystem moves are a rename relative to the open destination
+        directory. Returns (src, dst, ok) per source, like copy_into.
+        """
+        results = []
+        dst_dir_s = os.fspath(dst_dir)
+        dir_fd = _open_dir_fd(dst_dir_s) if os.rename in os.supports_dir_fd else None
         try:
-            shutil.move(str(src), str(dst))
-            return True
-        except Exception:
-            return False
+            for src in sources:
+                dst_s = os.path.join(dst_dir_s, src.name)
+                try:
+                    _move_path(src, dst_s, dir_fd)
+                    ok = True
+                except OSError:
+                    ok = False
+                results.append((src, Path(dst_s), ok))
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        return results
 
     @staticmethod
-    def delete_file(path: Path) -> bool:
+    def delete_file(path: Path) -> None:
         """Delete a file or directory."""
         try:
-            if path.is_dir():
-                shutil.rmtree(path)
-            else:
-                path.unlink()
-            return True
-        except Exception:
-            return False
+            path.unlink()
+        except IsADirectoryError:
+            shutil.rmtree(path)
+        except PermissionError:
+            # Windows and macOS report a directory as EACCES/EPERM
+            if not path.is_dir():
+                raise
+            shutil.rmtree(path)
 
     @staticmethod
-    def create_directory(path: Path) -> bool:
-        """Create a new directory."""
+    def delete_file_fast(path: str, is_dir: bool) -> None:
+        """Delete a file or directory given as a str path, for batch deletes.
+
+        is_dir picks the syscall to try first; a wrong guess falls back to
+        the other one, and non-empty directories to fast_rmtree.
+        """
+        if is_dir:
+            try:
+                os.rmdir(path)
+            except NotADirectoryError:
+                # A symlink to a directory
+                os.unlink(path)
+            except OSError as e:
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                    raise
+                FileOperations.fast_rmtree(path)
+        else:
+            try:
+                os.unlink(path)
+            except (IsADirectoryError, PermissionError):
+                if not os.path.isdir(path):
+                    raise
+                FileOperations.fast_rmtree(path)
+
+    @staticmethod
+    def fast_rmtree(path: Path) -> None:
+        """Remove a directory tree, using fd-relative syscalls where supported."""
+        if not _HAVE_FD_FUNCS:
+            shutil.rmtree(path)
+            return
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW | _O_CLOEXEC)
         try:
-            path.mkdir(parents=True, exist_ok=True)
-            return True
-        except Exception:
-            return False
+            _rmtree_fd(fd)
+        finally:
+            os.close(fd)
+        os.rmdir(path)
+
+    @staticmethod
+    def create_directory(path: Path) -> None:
+        """Create a new directory."""
+        os.makedirs(os.fspath(path), exist_ok=True)
 
     @staticmethod
-    def rename_file(src: Path, new_name: str) -> bool:
+    def rename_file(src: Path, new_name: str) -> None:
         """Rename a file or directory."""
-        try:
-            dst = src.parent / new_name
-            src.rename(dst)
-            return True
-        except Exception:
-            return False
+        src_s = os.fspath(src)
+        dst_s = os.path.join(os.path.dirname(src_s), new_name)
+        os.rename(src_s, dst_s)
 
     @staticmethod
-    def get_file_info(path: Path) -> Optional[dict]:
+    def get_file_info(path: Path) -> Optional[FileInfo]:
         """Get file information."""
         try:
-            stat = path.stat()
-            return {
-                "name": path.name,
-                "size": stat.st_size,
-                "is_dir": path.is_dir(),
-                "modified": stat.st_mtime,
-                "created": stat.st_ctime,
-            }
-        except Exception:
+            st = path.stat()
+        except OSError:
             return None
+        return FileInfo(path.name, st.st_size, stat.S_ISDIR(st.st_mode), st.st_mtime, st.st_ctime)
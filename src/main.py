@@ -1,8 +1,17 @@
 """Main application for Mo Commander (MC) v1.0 - A modern dual-pane file manager."""
 
+import errno
+import itertools
+import mmap
 import os
 import shutil
+import stat
+import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -11,13 +20,13 @@ from enum import Enum
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Footer, Header, Static, Input, Button, Label, OptionList, ListView
+from textual.widgets import Footer, Header, Static, Input, Button, Label, OptionList, ListView, ListItem
 from textual.widgets.option_list import Option
 from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.command import Provider, Hit
 
-from src.ui.panels import FilePanel
+from src.ui.panels import FileListItem, FilePanel
 from src.ui.themes import ThemeManager
 from src.core.config import Config
 from src.core.file_ops import FileOperations
@@ -28,6 +37,7 @@ class ActionType(Enum):
     COPY = "copy"
     MOVE = "move"
     DELETE = "delete"
+    DELETE_EMPTY = "delete_empty"
     MKDIR = "mkdir"
     RENAME = "rename"
 
@@ -39,16 +49,61 @@ class UndoAction:
     source: Path
     destination: Optional[Path] = None
     backup_path: Optional[Path] = None  # For deleted files
+    mode: int = 0  # For deleted empty files/dirs, recreated without a backup
+    times_ns: Optional[tuple[int, int]] = None
+    source_name: str = ""
+    dest_name: str = ""
+
+    def __post_init__(self):
+        # Cache display names so undo messages don't rebuild them
+        if not self.source_name:
+            self.source_name = self.source.name
+        if not self.dest_name and self.destination is not None:
+            self.dest_name = self.destination.name
 
 
 class UndoManager:
     """Manages undo history for file operations."""
 
+    STAGED_PREFIX = ".mocommander_undo_"
+
     def __init__(self, max_history: int = 50):
-        self.history: list[UndoAction] = []
+        self.history: deque[UndoAction] = deque(maxlen=max_history)
         self.max_history = max_history
         self.backup_dir = Path(tempfile.gettempdir()) / "mocommander_undo"
         self.backup_dir.mkdir(exist_ok=True)
+        self._backup_dev = os.stat(self.backup_dir).st_dev
+        # Numbers backup names; next() on a count is atomic across delete workers
+        self._backup_seq = itertools.count(1)
+        # Deletes staged beside the original, awaiting finalize_delete_backup
+        self._pending_backups: deque[UndoAction] = deque()
+        # The staged delete finalize_delete_backup is copying right now
+        self._copying: Optional[UndoAction] = None
+        # Guards backup paths and the staging state, never held while copying
+        self._backup_lock = threading.Lock()
+        # Lets one finalize_delete_backup run at a time, so _copying is a single slot
+        self._finalize_lock = threading.Lock()
+        self._undo_dispatch = {
+            ActionType.COPY: self._undo_copy,
+            ActionType.MOVE: self._undo_move,
+            ActionType.DELETE: self._undo_delete,
+            ActionType.DELETE_EMPTY: self._undo_delete_empty,
+            ActionType.MKDIR: self._undo_mkdir,
+            ActionType.RENAME: self._undo_rename,
+        }
+
+    @staticmethod
+    def _is_empty(path: Path, st: os.stat_result) -> bool:
+        """Check whether path is a zero-byte file or an empty directory."""
+        if stat.S_ISREG(st.st_mode):
+            return st.st_size == 0
+        if stat.S_ISDIR(st.st_mode):
+            try:
+                with os.scandir(path) as it:
+                    return next(it, None) is None
+            except OSError:
+                return False
+        return False
 
     def record_copy(self, source: Path, destination: Path) -> None:
         """Record a copy operation."""
@@ -58,20 +113,86 @@ class UndoManager:
         """Record a move operation."""
         self._add_action(UndoAction(ActionType.MOVE, source, destination))
 
-    def record_delete(self, path: Path) -> bool:
-        """Record a delete operation by backing up the file first."""
+    def record_delete(self, path: str | Path) -> bool:
+        """Record a delete operation by backing up the file first.
+
+        Empty files and directories aren't backed up at all; undo simply
+        recreates them. Returns True if the path has been moved away
+        (nothing left to delete), False if the caller still has to delete it.
+        """
+        moved = self.record_delete_sync(path)
+        self.finalize_delete_backup()
+        return moved
+
+    def record_delete_sync(self, path: str | Path) -> bool:
+        """Record a delete using renames only, leaving any copying for later.
+
+        On the same filesystem the path is renamed into the backup dir, which
+        performs the delete. Otherwise it is renamed to a hidden sibling and
+        copied into the backup dir by finalize_delete_backup. Returns as
+        record_delete does.
+        """
         try:
-            backup_name = f"{len(self.history)}_{path.name}"
-            backup_path = self.backup_dir / backup_name
-            if path.is_dir():
-                shutil.copytree(path, backup_path)
-            else:
-                shutil.copy2(path, backup_path)
-            self._add_action(UndoAction(ActionType.DELETE, path, backup_path=backup_path))
-            return True
-        except Exception:
+            st = os.lstat(path)
+        except OSError:
+            return False
+        if self._is_empty(path, st):
+            self._add_action(UndoAction(ActionType.DELETE_EMPTY, Path(path), mode=st.st_mode,
+                                        times_ns=(st.st_atime_ns, st.st_mtime_ns)))
             return False
 
+        backup_name = f"{next(self._backup_seq)}_{os.path.basename(path)}"
+        if st.st_dev == self._backup_dev:
+            try:
+                os.rename(path, self.backup_dir / backup_name)
+                self._add_action(UndoAction(ActionType.DELETE, Path(path), backup_path=self.backup_dir / backup_name))
+                return True
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    return False
+
+        staged = Path(os.path.dirname(path), self.STAGED_PREFIX + backup_name)
+        try:
+            os.rename(path, staged)
+        except OSError:
+            return False
+        action = UndoAction(ActionType.DELETE, Path(path), backup_path=staged)
+        self._add_action(action)
+        self._pending_backups.append(action)
+        return True
+
+    def finalize_delete_backup(self) -> None:
+        """Copy staged deletes into the backup dir; safe to run on a worker thread."""
+        with self._finalize_lock:
+            while True:
+                with self._backup_lock:
+                    if not self._pending_backups:
+                        return
+                    action = self._pending_backups.popleft()
+                    staged = action.backup_path
+                    mode = self._stat_type(staged) if staged else None
+                    if mode is None:
+                        # Undone, or dropped from history, in the meantime
+                        continue
+                    self._copying = action
+                backup_path = self.backup_dir / staged.name[len(self.STAGED_PREFIX):]
+                try:
+                    if mode == stat.S_IFDIR:
+                        shutil.copytree(staged, backup_path, symlinks=True)
+                    else:
+                        shutil.copy2(staged, backup_path, follow_symlinks=False)
+                    copied = True
+                except OSError:
+                    copied = False
+                with self._backup_lock:
+                    # Undo, eviction and cleanup clear _copying to claim the action
+                    keep = copied and self._copying is action
+                    self._copying = None
+                    if keep:
+                        action.backup_path = backup_path
+                # Until the backup is in place, undo works from the staged copy
+                self._remove_backup(staged if keep else backup_path)
+
     def record_mkdir(self, path: Path) -> None:
         """Record a mkdir operation."""
         self._add_action(UndoAction(ActionType.MKDIR, path))
@@ -80,17 +201,43 @@ class UndoManager:
         """Record a rename operation."""
         self._add_action(UndoAction(ActionType.RENAME, old_path, new_path))
 
+    @staticmethod
+    def _stat_type(path: Path) -> Optional[int]:
+        """Return the file type bits of path (without following symlinks), or None if missing."""
+        try:
+            return stat.S_IFMT(os.lstat(path).st_mode)
+        except FileNotFoundError:
+            return None
+
+    def record_batch(self, action_type: ActionType, results) -> None:
+        """Record the successful (source, destination, ok) results of a batch copy or move."""
+        for source, destination, ok in results:
+            if ok:
+                self._add_action(UndoAction(action_type, source, destination))
+
     def _add_action(self, action: UndoAction) -> None:
         """Add an action to history."""
+        if len(self.history) == self.history.maxlen:
+            # The deque drops the oldest action on append; clean up its backup first
+            oldest = self.history[0]
+            with self._backup_lock:
+                backup_path, oldest.backup_path = oldest.backup_path, None
+                if self._copying is oldest:
+                    self._copying = None
+            if backup_path:
+                self._remove_backup(backup_path)
         self.history.append(action)
-        if len(self.history) > self.max_history:
-            # Remove oldest and clean up any associated backup
-            oldest = self.history.pop(0)
-            if oldest.backup_path and oldest.backup_path.exists():
-                if oldest.backup_path.is_dir():
-                    shutil.rmtree(oldest.backup_path)
-                else:
-                    oldest.backup_path.unlink()
+
+    @staticmethod
+    def _remove_backup(path: Path) -> None:
+        """Delete a backup file or directory, ignoring errors."""
+        try:
+            if stat.S_ISDIR(os.lstat(path).st_mode):
+                FileOperations.fast_rmtree(path)
+            else:
+                os.unlink(path)
+        except OSError:
+            pass
 
     def can_undo(self) -> bool:
         """Check if there's an action to undo."""
@@ -102,78 +249,128 @@ class UndoManager:
             return False, "Nothing to undo"
 
         action = self.history.pop()
-
+        handler = self._undo_dispatch.get(action.action_type)
+        if handler is None:
+            return False, "Unknown action type"
+        with self._backup_lock:
+            # Claim the action, so no backup copy of it is swapped in while
+            # restoring; the restore itself runs without the lock
+            if self._copying is action:
+                self._copying = None
+            try:
+                self._pending_backups.remove(action)
+            except ValueError:
+                pass
         try:
-            if action.action_type == ActionType.COPY:
-                # Undo copy by deleting the copied file
-                if action.destination.exists():
-                    if action.destination.is_dir():
-                        shutil.rmtree(action.destination)
-                    else:
-                        action.destination.unlink()
-                return True, f"Undid copy: removed {action.destination.name}"
-
-            elif action.action_type == ActionType.MOVE:
-                # Undo move by moving back
-                if action.destination.exists():
-                    shutil.move(str(action.destination), str(action.source))
-                    return True, f"Undid move: restored {action.source.name}"
-                return False, f"Cannot undo: {action.destination.name} no longer exists"
-
-            elif action.action_type == ActionType.DELETE:
-                # Undo delete by restoring from backup
-                if action.backup_path and action.backup_path.exists():
-                    if action.backup_path.is_dir():
-                        shutil.copytree(action.backup_path, action.source)
-                        shutil.rmtree(action.backup_path)
-                    else:
-                        shutil.copy2(action.backup_path, action.source)
-                        action.backup_path.unlink()
-                    return True, f"Undid delete: restored {action.source.name}"
-                return False, "Cannot undo: backup not found"
-
-            elif action.action_type == ActionType.MKDIR:
-                # Undo mkdir by removing the directory (only if empty)
-                if action.source.exists() and action.source.is_dir():
-                    try:
-                        action.source.rmdir()  # Only removes if empty
-                        return True, f"Undid mkdir: removed {action.source.name}"
-                    except OSError:
-                        return False, f"Cannot undo: {action.source.name} is not empty"
-                return False, f"Cannot undo: {action.source.name} no longer exists"
-
-            elif action.action_type == ActionType.RENAME:
-                # Undo rename by renaming back
-                if action.destination.exists():
-                    action.destination.rename(action.source)
-                    return True, f"Undid rename: restored {action.source.name}"
-                return False, f"Cannot undo: {action.destination.name} no longer exists"
-
+            return handler(action)
         except Exception as e:
             return False, f"Undo failed: {e}"
 
-        return False, "Unknown action type"
+    def _undo_copy(self, action: UndoAction) -> tuple[bool, str]:
+        """Undo copy by deleting the copied file."""
+        mode = self._stat_type(action.destination)
+        if mode is not None:
+            if mode == stat.S_IFDIR:
+                shutil.rmtree(action.destination)
+            else:
+                action.destination.unlink()
+        return True, f"Undid copy: removed {action.dest_name}"
+
+    def _undo_move(self, action: UndoAction) -> tuple[bool, str]:
+        """Undo move by moving back."""
+        src, dst = os.fspath(action.destination), os.fspath(action.source)
+        try:
+            os.replace(src, dst)
+        except FileNotFoundError:
+            return False, f"Cannot undo: {action.dest_name} no longer exists"
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
+        return True, f"Undid move: restored {action.source_name}"
+
+    def _undo_delete(self, action: UndoAction) -> tuple[bool, str]:
+        """Undo delete by restoring from backup."""
+        mode = self._stat_type(action.backup_path) if action.backup_path else None
+        if mode is not None:
+            try:
+                os.rename(action.backup_path, action.source)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                if mode == stat.S_IFDIR:
+                    shutil.copytree(action.backup_path, action.source)
+                    shutil.rmtree(action.backup_path)
+                else:
+                    shutil.copy2(action.backup_path, action.source)
+                    action.backup_path.unlink()
+            return True, f"Undid delete: restored {action.source_name}"
+        return False, "Cannot undo: backup not found"
+
+    def _undo_delete_empty(self, action: UndoAction) -> tuple[bool, str]:
+        """Undo delete of an empty file or directory by recreating it."""
+        if stat.S_ISDIR(action.mode):
+            os.mkdir(action.source)
+        else:
+            os.close(os.open(action.source, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        os.chmod(action.source, stat.S_IMODE(action.mode))
+        if action.times_ns:
+            os.utime(action.source, ns=action.times_ns)
+        return True, f"Undid delete: restored {action.source_name}"
+
+    def _undo_mkdir(self, action: UndoAction) -> tuple[bool, str]:
+        """Undo mkdir by removing the directory (only if empty)."""
+        if self._stat_type(action.source) == stat.S_IFDIR:
+            try:
+                action.source.rmdir()  # Only removes if empty
+                return True, f"Undid mkdir: removed {action.source_name}"
+            except OSError:
+                return False, f"Cannot undo: {action.source_name} is not empty"
+        return False, f"Cannot undo: {action.source_name} no longer exists"
+
+    def _undo_rename(self, action: UndoAction) -> tuple[bool, str]:
+        """Undo rename by renaming back."""
+        if self._stat_type(action.destination) is not None:
+            action.destination.rename(action.source)
+            return True, f"Undid rename: restored {action.source_name}"
+        return False, f"Cannot undo: {action.dest_name} no longer exists"
+
+    _DESCRIPTIONS = {
+        ActionType.COPY: lambda a: f"Undo copy of {a.dest_name}",
+        ActionType.MOVE: lambda a: f"Undo move of {a.source_name}",
+        ActionType.DELETE: lambda a: f"Undo delete of {a.source_name}",
+        ActionType.DELETE_EMPTY: lambda a: f"Undo delete of {a.source_name}",
+        ActionType.MKDIR: lambda a: f"Undo mkdir {a.source_name}",
+        ActionType.RENAME: lambda a: f"Undo rename of {a.source_name}",
+    }
 
     def get_last_action_description(self) -> str:
         """Get a description of the last undoable action."""
         if not self.history:
             return "Nothing to undo"
         action = self.history[-1]
-        if action.action_type == ActionType.COPY:
-            return f"Undo copy of {action.destination.name}"
-        elif action.action_type == ActionType.MOVE:
-            return f"Undo move of {action.source.name}"
-        elif action.action_type == ActionType.DELETE:
-            return f"Undo delete of {action.source.name}"
-        elif action.action_type == ActionType.MKDIR:
-            return f"Undo mkdir {action.source.name}"
-        elif action.action_type == ActionType.RENAME:
-            return f"Undo rename of {action.source.name}"
-        return "Unknown action"
+        describe = self._DESCRIPTIONS.get(action.action_type)
+        return describe(action) if describe else "Unknown action"
 
     def cleanup(self) -> None:
         """Clean up all backup files."""
-        if self.backup_dir.exists():
+        with self._backup_lock:
+            # Staged deletes not yet backed up are simply deleted
+            staged = [action.backup_path for action in self._pending_backups]
+            self._pending_backups.clear()
+            if self._copying is not None:
+                staged.append(self._copying.backup_path)
+                self._copying.backup_path = None
+                self._copying = None
+        for path in staged:
+            if path:
+                self._remove_backup(path)
+        try:
+            FileOperations.fast_rmtree(self.backup_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Remove whatever can still be removed
             shutil.rmtree(self.backup_dir, ignore_errors=True)
 
 
@@ -186,17 +383,22 @@ class ThemeCommands(Provider):
         app = self.app
 
         if isinstance(app, MoCommander):
-            for theme_name in app.theme_manager.get_available_themes():
-                command_text = f"Switch to {theme_name} theme"
-                score = matcher.match(command_text)
-                # Yield all results when query is empty, or matching results otherwise
-                if not query or score > 0:
-                    yield Hit(
-                        score if query else 1.0,
-                        matcher.highlight(command_text),
-                        lambda t=theme_name: app.switch_to_theme(t),
-                        help=f"Change color scheme to {theme_name}"
-                    )
+            for theme_name, command_text in app._theme_command_texts:
+                app._ensure_theme_registered(theme_name)
+                # Yield everything unhighlighted for an empty query, matches otherwise
+                if not query:
+                    score, display = 1.0, command_text
+                else:
+                    score = matcher.match(command_text)
+                    if score <= 0:
+                        continue
+                    display = matcher.highlight(command_text)
+                yield Hit(
+                    score,
+                    display,
+                    lambda t=theme_name: app.switch_to_theme(t),
+                    help=f"Change color scheme to {theme_name}"
+                )
 
 
 class FileViewerScreen(ModalScreen[None]):
@@ -244,6 +446,9 @@ class FileViewerScreen(ModalScreen[None]):
     }
     """
 
+    # Larger files are truncated so the viewer stays responsive
+    MAX_VIEW_BYTES = 2 * 1024 * 1024
+
     def __init__(self, file_path: Path):
         super().__init__()
         self.file_path = file_path
@@ -253,21 +458,47 @@ class FileViewerScreen(ModalScreen[None]):
 
         with Vertical(id="viewer-container"):
             yield Label(f"File: {self.file_path.name}", id="viewer-title")
+            # Content is filled in by a worker thread once the file is read
+            yield TextArea("", id="viewer-content", read_only=True)
+            yield Label("Press ESC or F3 to close", id="viewer-footer")
+
+    def on_mount(self) -> None:
+        self.run_worker(self._load_file, thread=True, exclusive=True)
 
-            # Try to read the file
+    def _load_file(self) -> None:
+        """Read and decode the file off the UI thread."""
+        truncated = False
+        try:
+            fd = os.open(self.file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
             try:
-                content = self.file_path.read_text(encoding='utf-8')
-            except UnicodeDecodeError:
-                try:
-                    content = self.file_path.read_text(encoding='latin-1')
-                except Exception as e:
-                    content = f"Error reading file: {e}\n\n(This may be a binary file)"
-            except Exception as e:
-                content = f"Error reading file: {e}"
+                file_size = os.fstat(fd).st_size
+                truncated = file_size > self.MAX_VIEW_BYTES
+                size = min(file_size, self.MAX_VIEW_BYTES)
+                if size:
+                    # Decode straight from the mapping, skipping an intermediate bytes copy
+                    with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, "utf-8", "replace")
+                else:
+                    # Empty files and pseudo-files that report size 0 can't be mapped
+                    with os.fdopen(os.dup(fd), "rb") as f:
+                        data = f.read(self.MAX_VIEW_BYTES + 1)
+                    truncated = len(data) > self.MAX_VIEW_BYTES
+                    content = data[:self.MAX_VIEW_BYTES].decode("utf-8", errors="replace")
+            finally:
+                os.close(fd)
+        except Exception as e:
+            content = f"Error reading file: {e}"
+        self.app.call_from_thread(self._show_content, content, truncated)
 
-            viewer = TextArea(content, id="viewer-content", read_only=True)
-            yield viewer
-            yield Label("Press ESC or F3 to close", id="viewer-footer")
+    def _show_content(self, content: str, truncated: bool) -> None:
+        from textual.widgets import TextArea
+
+        self.query_one("#viewer-content", TextArea).load_text(content)
+        if truncated:
+            limit_mb = self.MAX_VIEW_BYTES // (1024 * 1024)
+            self.query_one("#viewer-title", Label).update(
+                f"File: {self.file_path.name} (truncated, showing first {limit_mb} MB)"
+            )
 
     def on_key(self, event) -> None:
         if event.key == "escape" or event.key == "f3":
@@ -313,6 +544,8 @@ class InputDialog(ModalScreen[str]):
     }
     """
 
+    BINDINGS = [Binding("escape", "cancel", show=False)]
+
     def __init__(self, title: str, prompt: str, default: str = ""):
         super().__init__()
         self.dialog_title = title
@@ -322,13 +555,25 @@ class InputDialog(ModalScreen[str]):
     def compose(self) -> ComposeResult:
         with Vertical(id="dialog"):
             yield Label(self.dialog_title, id="dialog-title")
-            yield Label(self.dialog_prompt)
+            yield Label(self.dialog_prompt, id="dialog-prompt")
             yield Input(value=self.default_value, id="dialog-input")
             with Horizontal(id="dialog-buttons"):
                 yield Button("OK", variant="primary", id="ok")
                 yield Button("Cancel", id="cancel")
 
-    def on_mount(self) -> None:
+    def set_text(self, title: str, prompt: str, default: str = "") -> None:
+        """Change the title, prompt and input value, e.g. before showing the dialog again."""
+        self.dialog_title = title
+        self.dialog_prompt = prompt
+        self.default_value = default
+        if self.is_mounted:
+            self.query_one("#dialog-title", Label).update(title)
+            self.query_one("#dialog-prompt", Label).update(prompt)
+            field = self.query_one(Input)
+            field.value = default
+            field.cursor_position = len(default)
+
+    def on_screen_resume(self) -> None:
         self.query_one(Input).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -341,9 +586,8 @@ class InputDialog(ModalScreen[str]):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         self.dismiss(event.value)
 
-    def on_key(self, event) -> None:
-        if event.key == "escape":
-            self.dismiss(None)
+    def action_cancel(self) -> None:
+        self.dismiss(None)
 
 
 class ConfirmDialog(ModalScreen[str]):
@@ -386,6 +630,12 @@ class ConfirmDialog(ModalScreen[str]):
     }
     """
 
+    BINDINGS = [
+        Binding("y", "yes", show=False),
+        Binding("n,escape", "no", show=False),
+        Binding("a", "all", show=False),
+    ]
+
     def __init__(self, title: str, message: str, show_all: bool = False):
         super().__init__()
         self.dialog_title = title
@@ -402,19 +652,34 @@ class ConfirmDialog(ModalScreen[str]):
                 if self.show_all:
                     yield Button("Yes to All (A)", variant="warning", id="all")
 
-    def on_mount(self) -> None:
+    def set_text(self, title: str, message: str) -> None:
+        """Change the title and message, e.g. before showing the dialog again."""
+        self.dialog_title = title
+        self.dialog_message = message
+        if self.is_mounted:
+            self.query_one("#confirm-title", Label).update(title)
+            self.query_one("#confirm-message", Label).update(message)
+
+    def on_screen_resume(self) -> None:
         self.query_one("#no", Button).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         self.dismiss(event.button.id)
 
-    def on_key(self, event) -> None:
-        if event.key == "y":
-            self.dismiss("yes")
-        elif event.key == "n" or event.key == "escape":
-            self.dismiss("no")
-        elif event.key == "a" and self.show_all:
-            self.dismiss("all")
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        # "Yes to All" only applies when the dialog offers it
+        if action == "all":
+            return self.show_all
+        return True
+
+    def action_yes(self) -> None:
+        self.dismiss("yes")
+
+    def action_no(self) -> None:
+        self.dismiss("no")
+
+    def action_all(self) -> None:
+        self.dismiss("all")
 
 
 class SortDialog(ModalScreen[str]):
@@ -464,6 +729,9 @@ class SortDialog(ModalScreen[str]):
         ("ext_asc", "Extension (A-Z)"),
         ("ext_desc", "Extension (Z-A)"),
     ]
+    _SORT_INDEX = {key: i for i, (key, _) in enumerate(SORT_OPTIONS)}
+    # Option lists keyed by current sort, each built once with a "> " marker
+    _OPTIONS_CACHE: dict[str, list[Option]] = {}
 
     def __init__(self, current_sort: str = "name_asc"):
         super().__init__()
@@ -473,20 +741,26 @@ class SortDialog(ModalScreen[str]):
         with Vertical(id="sort-dialog"):
             yield Label("Sort Files By", id="sort-title")
             option_list = OptionList(id="sort-options")
-            for key, label in self.SORT_OPTIONS:
-                marker = "> " if key == self.current_sort else "  "
-                option_list.add_option(Option(f"{marker}{label}", id=key))
+            option_list.add_options(self._options_for(self.current_sort))
             yield option_list
             yield Label("Enter to select, ESC to cancel", id="sort-footer")
 
+    @classmethod
+    def _options_for(cls, current_sort: str) -> list[Option]:
+        """Get the option list marking current_sort, building it on first use."""
+        opts = cls._OPTIONS_CACHE.get(current_sort)
+        if opts is None:
+            opts = [
+                Option(f"{'> ' if key == current_sort else '  '}{label}", id=key)
+                for key, label in cls.SORT_OPTIONS
+            ]
+            cls._OPTIONS_CACHE[current_sort] = opts
+        return opts
+
     def on_mount(self) -> None:
         option_list = self.query_one("#sort-options", OptionList)
         option_list.focus()
-        # Find and highlight current sort option
-        for i, (key, _) in enumerate(self.SORT_OPTIONS):
-            if key == self.current_sort:
-                option_list.highlighted = i
-                break
+        option_list.highlighted = self._SORT_INDEX.get(self.current_sort, 0)
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         self.dismiss(event.option.id)
@@ -550,14 +824,28 @@ class MoCommander(App):
         width: auto;
         dock: right;
         padding: 0 1;
-        background: #000000;
-        color: #00ffff;
+        background: $mc-copyright-background;
+        color: $mc-copyright-foreground;
     }
 
-    .directory {
+    /* List item text colors, keyed on the file type class of each label */
+    #file-list Label.directory, #file-list Label.drive {
+        color: $mc-directory-foreground;
         text-style: bold;
     }
 
+    #file-list Label.executable {
+        color: $mc-executable-foreground;
+    }
+
+    #file-list Label.archive {
+        color: $mc-archive-foreground;
+    }
+
+    #file-list Label.file {
+        color: $foreground;
+    }
+
     /* Selected items (space bar) */
     ListView > ListItem.-selected {
         text-style: bold;
@@ -565,8 +853,8 @@ class MoCommander(App):
 
     /* Header styling for better contrast */
     Header {
-        background: #000000;
-        color: #ffffff;
+        background: $mc-header-background;
+        color: $mc-header-foreground;
     }
 
     HeaderTitle {
@@ -631,6 +919,11 @@ class MoCommander(App):
 
     COMMANDS = {ThemeCommands}
 
+    # Seconds to wait for more changes before refreshing a panel
+    REFRESH_DELAY = 0.05
+    # Seconds to buffer panel path changes before saving them
+    CONFIG_FLUSH_DELAY = 1.0
+
     active_panel: reactive[str] = reactive("left")
 
     def __init__(self):
@@ -643,10 +936,23 @@ class MoCommander(App):
         self.right_panel = None
         self.show_hidden = self.config.get("show_hidden", False)
         self.current_sort = self.config.get("sort_order", "name_asc")
-
-        # Register our custom Textual themes
-        for name, theme in self.theme_manager.get_all_textual_themes().items():
-            self.register_theme(theme)
+        self._editor = self.config.get("editor", "notepad.exe")
+        self._delete_state: Optional[dict] = None
+        self._refresh_pending: set[FilePanel] = set()
+        # Panel paths waiting to be written to the config
+        self._pending_config: dict[str, str] = {}
+        self._config_timer = None
+        # Focused widget -> "left"/"right", filled as widgets first take focus
+        self._focus_panel_map: dict = {}
+        self._refresh_timer = None
+
+        # Register only the starting theme; the rest are registered on first use
+        self._registered_mc_themes: set[str] = set()
+        self._theme_apply_scheduled = False
+        self._ensure_theme_registered(self.theme_manager.current_theme)
+        self._theme_command_texts: list[tuple[str, str]] = [
+            (name, f"Switch to {name} theme") for name in self.theme_manager.get_available_themes()
+        ]
 
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
@@ -678,12 +984,25 @@ class MoCommander(App):
         self.call_after_refresh(self._initial_theme_apply)
         self.update_panel_focus()
 
+    def get_theme_variable_defaults(self) -> dict[str, str]:
+        """Fallback values for our CSS variables, used by built-in Textual themes."""
+        return {
+            "mc-header-background": "#000000",
+            "mc-header-foreground": "#ffffff",
+            "mc-copyright-background": "#000000",
+            "mc-copyright-foreground": "#00ffff",
+            "mc-directory-foreground": "#ffff00",
+            "mc-executable-foreground": "#00ff00",
+            "mc-archive-foreground": "#ff00ff",
+        }
+
     def _initial_theme_apply(self) -> None:
         """Apply theme on initial load."""
         self.apply_theme()
 
     def on_unmount(self) -> None:
         """Clean up on exit."""
+        self._flush_config()
         self.undo_manager.cleanup()
 
     def apply_theme(self) -> None:
@@ -693,39 +1012,18 @@ class MoCommander(App):
         if not self.is_mounted:
             return
 
-        # Set the Textual theme - this handles highlight colors via CSS variables
+        # Set the Textual theme. Screen, header and copyright colors all come
+        # from its CSS variables, so this is a single stylesheet update.
         textual_theme_name = self.theme_manager.get_textual_theme_name()
         self.theme = textual_theme_name
 
-        # Apply additional styling that Textual's theme doesn't cover
-        self.screen.styles.background = scheme.panel_bg
-
-        # Apply to header
-        try:
-            header = self.query_one(Header)
-            header.styles.background = scheme.header_bg
-            header.styles.color = scheme.header_fg
-        except Exception:
-            pass
-
-        # Apply to copyright text
-        try:
-            copyright_text = self.query_one("#copyright-text")
-            copyright_text.styles.background = scheme.footer_bg
-            copyright_text.styles.color = scheme.cursor_bg  # Use accent color
-        except Exception:
-            pass
-
-        # Apply to panels - this will also refresh their file lists with proper colors
+        # Apply to panels; list item colors follow the theme through CSS
         if self.left_panel:
             self.left_panel.set_color_scheme(scheme)
 
         if self.right_panel:
             self.right_panel.set_color_scheme(scheme)
 
-        # Force a full screen refresh
-        self.screen.refresh(repaint=True, layout=True)
-
     def update_panel_focus(self) -> None:
         """Update panel focus state."""
         if self.left_panel and self.right_panel:
@@ -749,10 +1047,43 @@ class MoCommander(App):
 
     def action_refresh(self) -> None:
         """Refresh both panels."""
-        if self.left_panel:
-            self.left_panel.refresh_file_list()
-        if self.right_panel:
-            self.right_panel.refresh_file_list()
+        for panel in (self.left_panel, self.right_panel):
+            if panel:
+                panel.invalidate_listing()
+                panel.refresh_file_list()
+
+    def _schedule_refresh(self, *panels) -> None:
+        """Refresh panels shortly, merging requests that arrive in a burst."""
+        self._refresh_pending.update(panel for panel in panels if panel is not None)
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(self.REFRESH_DELAY, self._flush_refresh)
+        else:
+            self._refresh_timer.reset()
+
+    def _flush_refresh(self) -> None:
+        """Refresh every panel with a pending refresh request."""
+        self._refresh_timer = None
+        pending, self._refresh_pending = self._refresh_pending, set()
+        for panel in pending:
+            # The change may not touch the directory's mtime (e.g. an overwrite)
+            panel.invalidate_listing()
+            panel.refresh_file_list()
+
+    def _panels_showing(self, *paths: Optional[Path]) -> list:
+        """Get the panels whose listing contains, or lies inside, any of paths."""
+        panels = []
+        for panel in (self.left_panel, self.right_panel):
+            if panel is None:
+                continue
+            current = os.path.normpath(panel.current_path)
+            for path in paths:
+                if path is None:
+                    continue
+                path_s = os.fspath(path)
+                if os.path.dirname(path_s) == current or (current + os.sep).startswith(path_s + os.sep):
+                    panels.append(panel)
+                    break
+        return panels
 
     def action_toggle_hidden(self) -> None:
         """Toggle showing hidden files."""
@@ -761,21 +1092,34 @@ class MoCommander(App):
 
         # Update panels to use new setting
         if self.left_panel:
-            self.left_panel.show_hidden = self.show_hidden
-            self.left_panel.refresh_file_list()
+            self.left_panel.set_show_hidden(self.show_hidden)
         if self.right_panel:
-            self.right_panel.show_hidden = self.show_hidden
-            self.right_panel.refresh_file_list()
+            self.right_panel.set_show_hidden(self.show_hidden)
 
         status = "shown" if self.show_hidden else "hidden"
         self.notify(f"Hidden files are now {status}")
 
+    def _ensure_theme_registered(self, theme_name: str) -> None:
+        """Register an MC theme with Textual if it hasn't been already."""
+        if theme_name not in self._registered_mc_themes:
+            self.register_theme(self.theme_manager.get_textual_theme(theme_name))
+            self._registered_mc_themes.add(theme_name)
+
     def switch_to_theme(self, theme_name: str) -> None:
         """Switch to a specific theme."""
         self.theme_manager.current_theme = theme_name
+        self._ensure_theme_registered(theme_name)
         self.config.set_theme(theme_name)
+        # Coalesce rapid switches (e.g. holding F2) into one apply per frame
+        if not self._theme_apply_scheduled:
+            self._theme_apply_scheduled = True
+            self.call_after_refresh(self._flush_pending_theme)
+
+    def _flush_pending_theme(self) -> None:
+        """Apply the most recently selected theme."""
+        self._theme_apply_scheduled = False
         self.apply_theme()
-        self.notify(f"Theme changed to: {theme_name}")
+        self.notify(f"Theme changed to: {self.theme_manager.current_theme}")
 
     def action_toggle_theme(self) -> None:
         """Cycle through available themes."""
@@ -809,11 +1153,14 @@ class MoCommander(App):
 
         item = panel.get_focused_item()
         if item and not item.is_dir:
-            editor = self.config.get("editor", "notepad.exe")
             try:
-                import subprocess
-                subprocess.Popen([editor, str(item.file_path)])
-                self.notify(f"Opening in {editor}: {item.filename}")
+                if os.name == "nt" and self._editor == Config.DEFAULT_CONFIG["editor"]:
+                    # No custom editor: let Windows open the file with its associated app
+                    os.startfile(str(item.file_path))
+                    self.notify(f"Opening: {item.filename}")
+                else:
+                    subprocess.Popen([self._editor, str(item.file_path)])
+                    self.notify(f"Opening in {self._editor}: {item.filename}")
             except Exception as e:
                 self.notify(f"Error opening file: {e}", severity="error")
 
@@ -826,34 +1173,56 @@ class MoCommander(App):
             self.notify("Panels not available", severity="error")
             return
 
+        preserve = self.config.get("preserve_full_metadata", False)
+        dst_dir = Path(inactive_panel.current_path)
         # Get items to copy - either selected items or focused item
         selected_items = active_panel.get_selected_items()
         if selected_items:
             # Copy multiple selected items
-            success_count = 0
-            failed_count = 0
-            for item_path in selected_items:
-                dst = Path(inactive_panel.current_path) / item_path.name
-                if self.file_ops.copy_file(item_path, dst):
-                    self.undo_manager.record_copy(item_path, dst)
-                    success_count += 1
-                else:
-                    failed_count += 1
-
-            active_panel.clear_selection()
-            inactive_panel.refresh_file_list()
-            self.notify(f"Copied {success_count} items, {failed_count} failed")
+            def copied_many(results) -> None:
+                inactive_panel.update_header()
+                self.undo_manager.record_batch(ActionType.COPY, results)
+                success_count = sum(ok for _, _, ok in results)
+                failed_count = len(results) - success_count
+
+                active_panel.clear_selection()
+                self._schedule_refresh(inactive_panel)
+                self.notify(f"Copied {success_count} items, {failed_count} failed")
+
+            def copy_many() -> None:
+                progress = self._transfer_progress(inactive_panel, "copying")
+                results = self.file_ops.copy_into(selected_items, dst_dir, preserve, progress)
+                self.call_from_thread(copied_many, results)
+
+            self.run_worker(copy_many, thread=True, group="transfer")
         else:
             # Copy single focused item
             item = active_panel.get_focused_item()
             if item and item.filename != "..":
-                dst = Path(inactive_panel.current_path) / item.filename
-                if self.file_ops.copy_file(item.file_path, dst):
-                    self.undo_manager.record_copy(item.file_path, dst)
-                    self.notify(f"Copied: {item.filename}")
-                    inactive_panel.refresh_file_list()
-                else:
-                    self.notify(f"Failed to copy: {item.filename}", severity="error")
+                src, name = item.file_path, item.filename
+                dst = dst_dir / name
+
+                def copied() -> None:
+                    inactive_panel.update_header()
+                    self.undo_manager.record_copy(src, dst)
+                    self.notify(f"Copied: {name}")
+                    self._schedule_refresh(inactive_panel)
+
+                def copy() -> None:
+                    progress = self._transfer_progress(inactive_panel, "copying")
+                    try:
+                        for n in self.file_ops.copy_file_iter(src, dst, preserve_full_metadata=preserve):
+                            progress(n)
+                    except OSError as e:
+                        self.call_from_thread(
+                            self.notify, f"Failed to copy: {name} ({e.strerror or e})", severity="error"
+                        )
+                        self.call_from_thread(inactive_panel.update_header)
+                    else:
+                        self.call_from_thread(copied)
+
+                # Large copies take a while, so they run on a worker thread
+                self.run_worker(copy, thread=True, group="transfer")
 
     def action_move(self) -> None:
         """Move file(s) from active to inactive panel."""
@@ -864,36 +1233,48 @@ class MoCommander(App):
             self.notify("Panels not available", severity="error")
             return
 
+        dst_dir = Path(inactive_panel.current_path)
         # Get items to move - either selected items or focused item
         selected_items = active_panel.get_selected_items()
         if selected_items:
             # Move multiple selected items
-            success_count = 0
-            failed_count = 0
-            for item_path in selected_items:
-                dst = Path(inactive_panel.current_path) / item_path.name
-                if self.file_ops.move_file(item_path, dst):
-                    self.undo_manager.record_move(item_path, dst)
-                    success_count += 1
-                else:
-                    failed_count += 1
+            def moved_many(results) -> None:
+                self.undo_manager.record_batch(ActionType.MOVE, results)
+                success_count = sum(ok for _, _, ok in results)
+                failed_count = len(results) - success_count
+
+                active_panel.clear_selection()
+                self._schedule_refresh(active_panel, inactive_panel)
+                self.notify(f"Moved {success_count} items, {failed_count} failed")
+
+            def move_many() -> None:
+                self.call_from_thread(moved_many, self.file_ops.move_into(selected_items, dst_dir))
 
-            active_panel.clear_selection()
-            active_panel.refresh_file_list()
-            inactive_panel.refresh_file_list()
-            self.notify(f"Moved {success_count} items, {failed_count} failed")
+            self.run_worker(move_many, thread=True, group="transfer")
         else:
             # Move single focused item
             item = active_panel.get_focused_item()
             if item and item.filename != "..":
-                dst = Path(inactive_panel.current_path) / item.filename
-                if self.file_ops.move_file(item.file_path, dst):
-                    self.undo_manager.record_move(item.file_path, dst)
-                    self.notify(f"Moved: {item.filename}")
-                    active_panel.refresh_file_list()
-                    inactive_panel.refresh_file_list()
-                else:
-                    self.notify(f"Failed to move: {item.filename}", severity="error")
+                src, name = item.file_path, item.filename
+                dst = dst_dir / name
+
+                def moved() -> None:
+                    self.undo_manager.record_move(src, dst)
+                    self.notify(f"Moved: {name}")
+                    self._schedule_refresh(active_panel, inactive_panel)
+
+                def move() -> None:
+                    try:
+                        self.file_ops.move_file(src, dst)
+                    except OSError as e:
+                        self.call_from_thread(
+                            self.notify, f"Failed to move: {name} ({e.strerror or e})", severity="error"
+                        )
+                    else:
+                        self.call_from_thread(moved)
+
+                # A move across filesystems is a copy, so it runs on a worker thread
+                self.run_worker(move, thread=True, group="transfer")
 
     def action_mkdir(self) -> None:
         """Create a new directory."""
@@ -905,15 +1286,17 @@ class MoCommander(App):
         def check_result(dirname: str | None) -> None:
             if dirname:
                 new_dir = Path(panel.current_path) / dirname
-                if self.file_ops.create_directory(new_dir):
+                try:
+                    self.file_ops.create_directory(new_dir)
+                except OSError as e:
+                    self.notify(f"Failed to create directory: {dirname} ({e.strerror or e})", severity="error")
+                else:
                     self.undo_manager.record_mkdir(new_dir)
                     self.notify(f"Created directory: {dirname}")
-                    panel.refresh_file_list()
-                else:
-                    self.notify(f"Failed to create directory: {dirname}", severity="error")
+                    self._schedule_refresh(panel)
 
         self.push_screen(
-            InputDialog("Create Directory", "Enter directory name:"),
+            self._input_dialog("Create Directory", "Enter directory name:"),
             check_result
         )
 
@@ -924,99 +1307,206 @@ class MoCommander(App):
             return
 
         # Get items to delete - either selected items or focused item
-        selected_items = panel.get_selected_items()
-        if selected_items:
-            # Delete multiple selected items
-            self._delete_multiple_items(panel, selected_items)
-        else:
-            # Delete single focused item
+        items = panel.get_selected_entries()
+        if not items:
             item = panel.get_focused_item()
-            if item and item.filename != "..":
-                self._delete_single_item(panel, item)
+            if item is None or item.filename == "..":
+                return
+            items = [(item.file_path, item.is_dir)]
+        self._delete_items(panel, items)
+
+    def _delete_items(self, panel, items: list[tuple[Path, bool]]) -> None:
+        """Delete (path, is_dir) items, confirming each one."""
+        # str paths from here on; the delete loop needs no Path objects
+        items = [(os.fspath(path), is_dir) for path, is_dir in items]
+        if len(items) == 1:
+            self._delete_single_item(panel, *items[0])
+            return
+        self._delete_state = {
+            "items": items,
+            "index": 0,
+            "deleted": 0,
+            "failed": 0,
+            "panel": panel,
+        }
+        self._prompt_next_delete()
+
+    def _delete_single_item(self, panel, path: str, is_dir: bool) -> None:
+        """Delete one item, with a plain Yes/No confirmation."""
+        name = os.path.basename(path)
+
+        def deleted() -> None:
+            self.notify(f"Deleted: {name}")
+            if panel.selected_files:
+                panel.clear_selection()
+            self._schedule_refresh(panel)
+
+        def delete() -> None:
+            try:
+                self._delete_with_backup(path, is_dir)
+            except OSError as e:
+                self.call_from_thread(
+                    self.notify, f"Failed to delete: {name} ({e.strerror or e})", severity="error"
+                )
+            else:
+                self.call_from_thread(deleted)
 
-    def _delete_single_item(self, panel, item) -> None:
-        """Delete a single item with confirmation."""
         def handle_confirm(result):
             if result == "yes":
-                # Backup for undo before deleting
-                self.undo_manager.record_delete(item.file_path)
-                if self.file_ops.delete_file(item.file_path):
-                    self.notify(f"Deleted: {item.filename}")
-                    panel.refresh_file_list()
-                else:
-                    self.notify(f"Failed to delete: {item.filename}", severity="error")
+                # Dialog callbacks run on the app's message pump, so the
+                # delete itself goes to a worker thread
+                self.run_worker(delete, thread=True, group="delete")
 
-        item_type = "directory" if item.is_dir else "file"
+        item_type = "directory" if is_dir else "file"
         self.push_screen(
-            ConfirmDialog(
+            self._confirm_dialog(
                 "Confirm Delete",
-                f"Delete {item_type}: {item.filename}?",
+                f"Delete {item_type}: {name}?",
                 show_all=False
             ),
             handle_confirm
         )
 
-    def _delete_multiple_items(self, panel, items: list[Path]) -> None:
-        """Delete multiple items with confirmation."""
-        total_items = len(items)
-        deleted_count = 0
-        failed_count = 0
-        delete_all = False
-
-        def delete_next(index=0):
-            nonlocal deleted_count, failed_count, delete_all
+    def _prompt_next_delete(self) -> None:
+        """Ask about the next item of a multi-item delete, or finish it."""
+        state = self._delete_state
+        items, index = state["items"], state["index"]
+        if index >= len(items):
+            # Done deleting
+            panel = state["panel"]
+            self._delete_state = None
+            panel.clear_selection()
+            self._schedule_refresh(panel)
+            self.notify(f"Deleted {state['deleted']} items, {state['failed']} failed")
+            return
 
-            if index >= total_items:
-                # Done deleting
-                panel.clear_selection()
-                panel.refresh_file_list()
-                self.notify(f"Deleted {deleted_count} items, {failed_count} failed")
-                return
+        item_path, is_dir = items[index]
+        item_type = "directory" if is_dir else "file"
+        self.push_screen(
+            self._confirm_dialog(
+                f"Confirm Delete ({index + 1}/{len(items)})",
+                f"Delete {item_type}: {os.path.basename(item_path)}?",
+                show_all=True
+            ),
+            self._on_delete_answer
+        )
 
-            item_path = items[index]
-            item_name = item_path.name
-            item_type = "directory" if item_path.is_dir() else "file"
-
-            def handle_confirm(result):
-                nonlocal deleted_count, failed_count, delete_all
-
-                if result == "no":
-                    # Skip this item
-                    delete_next(index + 1)
-                elif result in ("yes", "all"):
-                    if result == "all":
-                        delete_all = True
-
-                    # Backup for undo before deleting
-                    self.undo_manager.record_delete(item_path)
-                    # Delete the item
-                    if self.file_ops.delete_file(item_path):
-                        deleted_count += 1
-                    else:
-                        failed_count += 1
+    def _on_delete_answer(self, result: str | None) -> None:
+        """Handle the answer for the current item of a multi-item delete."""
+        state = self._delete_state
+        items, index = state["items"], state["index"]
+        if result == "all":
+            # Delete this and all remaining items in one worker job
+            self.run_worker(lambda: self._delete_rest(state, items[index:]), thread=True, group="delete")
+        elif result == "yes":
+            self.run_worker(lambda: self._delete_current(state, items[index]), thread=True, group="delete")
+        else:
+            state["index"] = index + 1
+            self._prompt_next_delete()
 
-                    delete_next(index + 1)
+    def _delete_current(self, state: dict, item: tuple[str, bool]) -> None:
+        """Delete the current item of a multi-item delete; runs on a worker thread."""
+        try:
+            self._delete_with_backup(*item)
+            deleted, failed = 1, 0
+        except OSError:
+            deleted, failed = 0, 1
+        self.call_from_thread(self._delete_step_done, state, deleted, failed, state["index"] + 1)
+
+    def _delete_rest(self, state: dict, items: list[tuple[str, bool]]) -> None:
+        """Delete the remaining items of a multi-item delete; runs on a worker thread."""
+        deleted, failed = self._bulk_delete(state["panel"], items)
+        self.call_from_thread(self._delete_step_done, state, deleted, failed, len(state["items"]), True)
+
+    def _delete_step_done(self, state: dict, deleted: int, failed: int, next_index: int,
+                          finalize: bool = False) -> None:
+        """Count finished deletes and ask about the next item."""
+        state["deleted"] += deleted
+        state["failed"] += failed
+        state["index"] = next_index
+        if finalize:
+            # Copy cross-filesystem backups now that the batch is done
+            self.run_worker(self.undo_manager.finalize_delete_backup, thread=True, group="undo-backup")
+        if self._delete_state is state:
+            self._prompt_next_delete()
+        else:
+            # A delete started meanwhile has replaced this one's state
+            self._schedule_refresh(state["panel"])
+
+    def _get_dialog(self, name: str, factory):
+        """Get a pooled dialog, building it on first use."""
+        if not self.is_screen_installed(name):
+            # Installed screens survive being dismissed, so they can be pushed again
+            self.install_screen(factory(), name=name)
+        return self.get_screen(name)
+
+    def _confirm_dialog(self, title: str, message: str, show_all: bool = False) -> ConfirmDialog:
+        """Get the pooled confirmation dialog, set up with the given text."""
+        name = "confirm-all" if show_all else "confirm"
+        dialog = self._get_dialog(name, lambda: ConfirmDialog("", "", show_all=show_all))
+        dialog.set_text(title, message)
+        return dialog
+
+    def _input_dialog(self, title: str, prompt: str, default: str = "") -> InputDialog:
+        """Get the pooled input dialog, set up with the given text."""
+        dialog = self._get_dialog("input", lambda: InputDialog("", ""))
+        dialog.set_text(title, prompt, default)
+        return dialog
+
+    def _bulk_delete(self, panel, items: list[tuple[str, bool]]) -> tuple[int, int]:
+        """Delete (path, is_dir) items with undo backups; runs on a worker thread.
+
+        Returns (deleted, failed). Progress is shown in the panel header.
+        """
+        deleted = failed = 0
+        total = len(items)
+        for i, (path, is_dir) in enumerate(items, 1):
+            try:
+                # Backups that need copying are finished once the batch is done
+                if not self.undo_manager.record_delete_sync(path):
+                    self.file_ops.delete_file_fast(path, is_dir)
+                deleted += 1
+            except OSError:
+                failed += 1
+            if i % 64 == 0:
+                self.call_from_thread(self._show_delete_progress, panel, i, total)
+        return deleted, failed
+
+    def _transfer_progress(self, panel, verb: str):
+        """Build a progress callback that shows bytes done in a panel header.
+
+        Meant for worker threads; the header is updated at most ten times a second.
+        """
+        done = 0
+        shown = 0.0
+
+        def progress(n: int) -> None:
+            nonlocal done, shown
+            done += n
+            now = time.monotonic()
+            if now - shown >= 0.1:
+                shown = now
+                self.call_from_thread(self._show_transfer_progress, panel, verb, done)
+
+        return progress
+
+    @staticmethod
+    def _show_transfer_progress(panel, verb: str, done: int) -> None:
+        """Show copy or move progress in a panel header."""
+        panel.query_one("#path-header", Static).update(
+            f"{panel.current_path} [{verb} {FileListItem._format_size(done)}]"
+        )
 
-            # Show confirmation unless "Yes to All" was selected
-            if delete_all:
-                # Backup for undo before deleting
-                self.undo_manager.record_delete(item_path)
-                if self.file_ops.delete_file(item_path):
-                    deleted_count += 1
-                else:
-                    failed_count += 1
-                delete_next(index + 1)
-            else:
-                self.push_screen(
-                    ConfirmDialog(
-                        f"Confirm Delete ({index + 1}/{total_items})",
-                        f"Delete {item_type}: {item_name}?",
-                        show_all=True
-                    ),
-                    handle_confirm
-                )
+    @staticmethod
+    def _show_delete_progress(panel, done: int, total: int) -> None:
+        """Show bulk delete progress in a panel header."""
+        panel.query_one("#path-header", Static).update(f"{panel.current_path} [deleting {done}/{total}]")
 
-        delete_next()
+    def _delete_with_backup(self, path: str, is_dir: bool) -> None:
+        """Back up path for undo and delete it; runs on a worker thread."""
+        # On the same filesystem the backup rename is the delete
+        if not self.undo_manager.record_delete(path):
+            self.file_ops.delete_file_fast(path, is_dir)
 
     def action_menu(self) -> None:
         """Show main menu."""
@@ -1028,16 +1518,30 @@ class MoCommander(App):
             self.notify("Nothing to undo")
             return
 
+        action = self.undo_manager.history[-1]
+        panels = self._panels_showing(action.source, action.destination)
+        # Restoring can copy across filesystems, so it runs off the UI thread
+        self.run_worker(lambda: self._undo_worker(panels), thread=True, group="undo")
+
+    def _undo_worker(self, panels: list) -> None:
+        """Undo the last action and rescan the panels it touched; runs on a worker thread."""
         success, message = self.undo_manager.undo()
-        if success:
+        if not success:
+            self.call_from_thread(self.notify, message, severity="error")
+            return
+        # Rescan only the panels showing a directory the undo touched,
+        # both at once so slow mounts don't block one after the other
+        for panel in panels:
+            panel.invalidate_listing()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            scans = list(executor.map(lambda panel: panel._scan_dir(), panels))
+
+        def apply() -> None:
             self.notify(message)
-            # Refresh both panels
-            if self.left_panel:
-                self.left_panel.refresh_file_list()
-            if self.right_panel:
-                self.right_panel.refresh_file_list()
-        else:
-            self.notify(message, severity="error")
+            for panel, scan in zip(panels, scans):
+                panel._apply_scan(scan)
+
+        self.call_from_thread(apply)
 
     def action_rename(self) -> None:
         """Rename the selected file or directory."""
@@ -1051,35 +1555,47 @@ class MoCommander(App):
             self.notify("Select a file or directory to rename", severity="warning")
             return
 
+        old_name = item.filename
+        old_path = item.file_path
+
+        def renamed(new_name: str) -> None:
+            self.undo_manager.record_rename(old_path, old_path.parent / new_name)
+            self.notify(f"Renamed: {old_name} -> {new_name}")
+            self._schedule_refresh(panel)
+
+        def rename(new_name: str) -> None:
+            try:
+                self.file_ops.rename_file(old_path, new_name)
+            except OSError as e:
+                self.call_from_thread(
+                    self.notify, f"Failed to rename: {old_name} ({e.strerror or e})", severity="error"
+                )
+            else:
+                self.call_from_thread(renamed, new_name)
+
         def check_result(new_name: str | None) -> None:
-            if new_name and new_name != item.filename:
-                old_path = item.file_path
-                new_path = old_path.parent / new_name
-                if self.file_ops.rename_file(old_path, new_name):
-                    self.undo_manager.record_rename(old_path, new_path)
-                    self.notify(f"Renamed: {item.filename} -> {new_name}")
-                    panel.refresh_file_list()
-                else:
-                    self.notify(f"Failed to rename: {item.filename}", severity="error")
+            if new_name and new_name != old_name:
+                self.run_worker(lambda: rename(new_name), thread=True)
 
         self.push_screen(
-            InputDialog("Rename", f"Rename '{item.filename}' to:", item.filename),
+            self._input_dialog("Rename", f"Rename '{item.filename}' to:", item.filename),
             check_result
         )
 
     def action_sort(self) -> None:
         """Show sort options dialog."""
         def handle_sort(sort_order: str | None) -> None:
+            if sort_order == self.current_sort:
+                # Re-picked the current order; nothing to re-sort or save
+                return
             if sort_order:
                 self.current_sort = sort_order
                 self.config.set("sort_order", sort_order)
                 # Apply to both panels
                 if self.left_panel:
-                    self.left_panel.sort_order = sort_order
-                    self.left_panel.refresh_file_list()
+                    self.left_panel.resort_in_memory(sort_order)
                 if self.right_panel:
-                    self.right_panel.sort_order = sort_order
-                    self.right_panel.refresh_file_list()
+                    self.right_panel.resort_in_memory(sort_order)
                 self.notify(f"Sort order: {sort_order.replace('_', ' ')}")
 
         self.push_screen(
@@ -1097,23 +1613,52 @@ class MoCommander(App):
     def on_file_panel_path_changed(self, message: FilePanel.PathChanged) -> None:
         """Handle path changes in panels."""
         if message.control == self.left_panel:
-            self.config.set("left_panel_path", message.path)
+            key = "left_panel_path"
         elif message.control == self.right_panel:
-            self.config.set("right_panel_path", message.path)
+            key = "right_panel_path"
+        else:
+            return
+        # Buffer the path; browsing quickly through directories writes once
+        self._pending_config[key] = message.path
+        if self._config_timer is None:
+            self._config_timer = self.set_timer(self.CONFIG_FLUSH_DELAY, self._flush_config)
+
+    def _flush_config(self) -> None:
+        """Write buffered panel paths to the config."""
+        if self._config_timer is not None:
+            self._config_timer.stop()
+            self._config_timer = None
+        if self._pending_config:
+            pending, self._pending_config = self._pending_config, {}
+            with self.config.batch():
+                for key, value in pending.items():
+                    self.config.set(key, value)
 
     def on_descendant_focus(self, event) -> None:
         """Track which panel has focus."""
-        # Check if the focused widget or any of its ancestors is a panel
         widget = event.widget
+        name = self._focus_panel_map.get(widget)
+        if name is None:
+            name = self._find_panel_name(widget)
+            if name is None:
+                return
+            # List items are rebuilt on every refresh, so don't hold on to them
+            if not isinstance(widget, ListItem):
+                self._focus_panel_map[widget] = name
+        self.active_panel = name
+
+    @staticmethod
+    def _find_panel_name(widget) -> Optional[str]:
+        """Get "left"/"right" for the panel containing widget, or None."""
+        # Check if the widget or any of its ancestors is a panel
         while widget is not None:
-            if hasattr(widget, 'id'):
-                if widget.id == "left-panel":
-                    self.active_panel = "left"
-                    return
-                elif widget.id == "right-panel":
-                    self.active_panel = "right"
-                    return
+            widget_id = getattr(widget, 'id', None)
+            if widget_id == "left-panel":
+                return "left"
+            elif widget_id == "right-panel":
+                return "right"
             widget = widget.parent
+        return None
 
 
 def main():
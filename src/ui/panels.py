@@ -1,9 +1,16 @@
 """File panel widgets for dual-pane file browser - MC v1.0."""
 
+import asyncio
 import os
+import stat
 import string
 import ctypes
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
@@ -13,6 +20,7 @@ from textual.widgets import Static, ListView, ListItem, Label
 from textual.reactive import reactive
 from textual.message import Message
 
+
 if TYPE_CHECKING:
     from src.ui.themes import ColorScheme
 
@@ -20,47 +28,153 @@ if TYPE_CHECKING:
 # Special path constant for "This PC" view
 THIS_PC = "This PC"
 
+# Directory listings each panel keeps for quick re-display
+_DIR_CACHE_MAX = 32
+
+# Rows turned into list items at a time; the rest wait until scrolled near
+_RENDER_CHUNK = 200
+
+# Selected-directory counts remembered per panel before starting over
+_COUNT_CACHE_MAX = 256
+
+# File size units below PB, each 1024 times the last
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Extensions colored as executables and archives
+_EXEC_EXT = frozenset({".exe", ".bat", ".cmd", ".ps1", ".com"})
+_ARCHIVE_EXT = frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".arc", ".arj", ".lzh"})
+
+# Sort key per sort_order prefix, over (name, is_dir, size, mtime, path) entries
+_SORT_COLUMNS = {
+    "name": lambda e: e[0].lower(),
+    "size": itemgetter(2),
+    "date": itemgetter(3),
+    "ext": lambda e: e[0].rsplit(".", 1)[-1].lower() if "." in e[0] else "",
+}
+
+# Seconds a drive list is reused before the drives are probed again
+_DRIVES_TTL = 5.0
+_DRIVES_CACHE: Optional[tuple[float, list]] = None
+
+# Drive types (GetDriveTypeW) whose label and sizes are only read on demand;
+# an empty removable or CD-ROM drive can take seconds to answer
+_LAZY_DRIVE_TYPES = (2, 5)
+# Drive type per letter, recorded by the last listing
+_DRIVE_TYPES: dict[str, int] = {}
+
+# Drives probed at once; each probe may wait on a slow network share
+_DRIVE_PROBE_WORKERS = 8
+
+SEM_FAILCRITICALERRORS = 0x0001
+
+# Windows hidden attribute bit, looked up once rather than per directory entry
+FILE_ATTRIBUTE_HIDDEN = getattr(stat, "FILE_ATTRIBUTE_HIDDEN", 0x2)
+
+
+def get_drive_details(drive_letter: str) -> tuple[str, int, int]:
+    """Read a Windows drive's (label, total_bytes, free_bytes)."""
+    kernel32 = ctypes.windll.kernel32
+    drive_path = f"{drive_letter}:\\"
+    label_buf = ctypes.create_unicode_buffer(256)
+    free_bytes = ctypes.c_ulonglong(0)
+    total_bytes = ctypes.c_ulonglong(0)
+    # Fail quietly on a drive without media instead of raising a system dialog
+    old_mode = ctypes.c_uint(0)
+    kernel32.SetThreadErrorMode(SEM_FAILCRITICALERRORS, ctypes.byref(old_mode))
+    try:
+        kernel32.GetVolumeInformationW(
+            drive_path, label_buf, 256, None, None, None, None, 0
+        )
+        kernel32.GetDiskFreeSpaceExW(
+            drive_path,
+            ctypes.byref(free_bytes),
+            ctypes.byref(total_bytes),
+            None
+        )
+    finally:
+        kernel32.SetThreadErrorMode(old_mode.value, None)
+    return label_buf.value or "Local Disk", total_bytes.value, free_bytes.value
+
 
 def get_available_drives() -> list[tuple[str, str, int, int]]:
     """Get list of available drives on Windows.
 
-    Returns list of tuples: (drive_letter, label, total_bytes, free_bytes)
+    Returns list of tuples: (drive_letter, label, total_bytes, free_bytes).
+    Only drive types are probed here; Windows drives have an empty label
+    until _probe_drive_slow fills them in. The list is cached for
+    _DRIVES_TTL seconds.
     """
+    global _DRIVES_CACHE
+    now = time.monotonic()
+    if _DRIVES_CACHE is not None and now - _DRIVES_CACHE[0] < _DRIVES_TTL:
+        return _DRIVES_CACHE[1]
+    drives = _list_drives()
+    _DRIVES_CACHE = (now, drives)
+    return drives
+
+
+def _remember_drive_details(letter: str, label: str, total: int, free: int) -> None:
+    """Store details read after listing in the cached drive list."""
+    if _DRIVES_CACHE is None:
+        return
+    drives = _DRIVES_CACHE[1]
+    for i, drive in enumerate(drives):
+        if drive[0] == letter:
+            drives[i] = (letter, label, total, free)
+            break
+
+
+def _details_on_demand(letter: str) -> bool:
+    """Check whether a drive's details wait until the user moves onto it."""
+    return _DRIVE_TYPES.get(letter) in _LAZY_DRIVE_TYPES
+
+
+def _probe_drive_fast(letter: str) -> Optional[tuple[str, int]]:
+    """Read a Windows drive letter's type, or return None for unlisted drive types."""
+    try:
+        drive_type = ctypes.windll.kernel32.GetDriveTypeW(f"{letter}:\\")
+    except Exception:
+        return None
+    # 2=Removable, 3=Fixed, 4=Network, 5=CD-ROM, 6=RAM disk
+    if drive_type in (2, 3, 4, 5, 6):
+        return (letter, drive_type)
+    return None
+
+
+def _probe_drive_slow(letter: str) -> tuple[str, int, int]:
+    """Read a drive's (label, total_bytes, free_bytes), which may take seconds."""
+    try:
+        return get_drive_details(letter)
+    except Exception:
+        # Drive exists but can't get info (e.g., empty CD drive)
+        return ("Drive", 0, 0)
+
+
+def _statvfs_one(mount_point: str) -> tuple[str, str, int, int]:
+    """Read a Unix mount point's (mount_point, label, total_bytes, free_bytes)."""
+    label = os.path.basename(mount_point) or "Root"
+    try:
+        vfs = os.statvfs(mount_point)
+    except Exception:
+        return (mount_point, label, 0, 0)
+    return (mount_point, label, vfs.f_blocks * vfs.f_frsize, vfs.f_bfree * vfs.f_frsize)
+
+
+def _list_drives() -> list[tuple[str, str, int, int]]:
+    """Probe the available drives; see get_available_drives."""
     drives = []
 
     if os.name == 'nt':
         # Windows: use ctypes to get drive info
         try:
             bitmask = ctypes.windll.kernel32.GetLogicalDrives()
-            for letter in string.ascii_uppercase:
-                if bitmask & 1:
-                    drive_path = f"{letter}:\\"
-                    try:
-                        # Get drive type
-                        drive_type = ctypes.windll.kernel32.GetDriveTypeW(drive_path)
-                        # 2=Removable, 3=Fixed, 4=Network, 5=CD-ROM, 6=RAM disk
-                        if drive_type in (2, 3, 4, 5, 6):
-                            # Get volume info
-                            label_buf = ctypes.create_unicode_buffer(256)
-                            ctypes.windll.kernel32.GetVolumeInformationW(
-                                drive_path, label_buf, 256, None, None, None, None, 0
-                            )
-                            label = label_buf.value or "Local Disk"
-
-                            # Get disk space
-                            free_bytes = ctypes.c_ulonglong(0)
-                            total_bytes = ctypes.c_ulonglong(0)
-                            ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                                drive_path,
-                                ctypes.byref(free_bytes),
-                                ctypes.byref(total_bytes),
-                                None
-                            )
-                            drives.append((letter, label, total_bytes.value, free_bytes.value))
-                    except Exception:
-                        # Drive exists but can't get info (e.g., empty CD drive)
-                        drives.append((letter, "Drive", 0, 0))
-                bitmask >>= 1
+            for i, letter in enumerate(string.ascii_uppercase):
+                if bitmask >> i & 1:
+                    probed = _probe_drive_fast(letter)
+                    if probed is not None:
+                        _DRIVE_TYPES[letter] = probed[1]
+                        # Label and sizes are read later by _probe_drive_slow
+                        drives.append((letter, "", 0, 0))
         except Exception:
             # Fallback: just check for common drives
             for letter in string.ascii_uppercase:
@@ -71,19 +185,16 @@ def get_available_drives() -> list[tuple[str, str, int, int]]:
         # Unix-like: show mount points
         try:
             with open('/proc/mounts', 'r') as f:
+                candidates = []
                 for line in f:
                     parts = line.split()
                     if len(parts) >= 2:
                         mount_point = parts[1]
-                        if mount_point.startswith('/media') or mount_point.startswith('/mnt') or mount_point == '/':
-                            try:
-                                stat = os.statvfs(mount_point)
-                                total = stat.f_blocks * stat.f_frsize
-                                free = stat.f_bfree * stat.f_frsize
-                                label = os.path.basename(mount_point) or "Root"
-                                drives.append((mount_point, label, total, free))
-                            except Exception:
-                                drives.append((mount_point, os.path.basename(mount_point) or "Root", 0, 0))
+                        if mount_point == '/' or mount_point.startswith(('/media', '/mnt', '/run/media')):
+                            candidates.append(mount_point)
+            # statvfs can block on a stale network mount, so query them concurrently
+            with ThreadPoolExecutor(max_workers=_DRIVE_PROBE_WORKERS) as executor:
+                drives.extend(executor.map(_statvfs_one, candidates))
         except Exception:
             # Fallback for non-Linux Unix
             drives.append(("/", "Root", 0, 0))
@@ -94,14 +205,14 @@ def get_available_drives() -> list[tuple[str, str, int, int]]:
 class DriveListItem(ListItem):
     """A list item representing a drive."""
 
-    def __init__(self, drive_letter: str, label: str, total_bytes: int, free_bytes: int,
-                 color_scheme: Optional["ColorScheme"] = None, **kwargs):
+    def __init__(self, drive_letter: str, label: str, total_bytes: int, free_bytes: int, **kwargs):
         super().__init__(**kwargs)
         self.drive_letter = drive_letter
         self.drive_label = label
         self.total_bytes = total_bytes
         self.free_bytes = free_bytes
-        self._color_scheme = color_scheme
+        # Windows drives are listed before their label and sizes are read
+        self.details_pending = not label
         # For Windows, construct path like "C:\"; for Unix, use mount point directly
         if os.name == 'nt':
             self.drive_path = Path(f"{drive_letter}:\\")
@@ -110,37 +221,36 @@ class DriveListItem(ListItem):
 
     def compose(self) -> ComposeResult:
         """Compose the drive list item."""
+        yield Label(self._label_text(), classes="drive", id="item-label")
+
+    def set_details(self, label: str, total_bytes: int, free_bytes: int) -> None:
+        """Fill in details that were read after the item was created."""
+        self.drive_label = label
+        self.total_bytes = total_bytes
+        self.free_bytes = free_bytes
+        self.details_pending = False
+        # The label may be composed before the item is fully mounted
+        for label_widget in self.query("#item-label").results(Label):
+            label_widget.update(self._label_text())
+
+    def _label_text(self) -> str:
+        """Build the row text."""
+        drive_label = self.drive_label or "Drive"
         if os.name == 'nt':
-            display_name = f"{self.drive_label} ({self.drive_letter}:)"
+            display_name = f"{drive_label} ({self.drive_letter}:)"
         else:
-            display_name = f"{self.drive_label} ({self.drive_letter})"
+            display_name = f"{drive_label} ({self.drive_letter})"
 
-        if self.total_bytes > 0:
+        if self.details_pending:
+            size_info = "…"
+        elif self.total_bytes > 0:
             total_str = self._format_size(self.total_bytes)
             free_str = self._format_size(self.free_bytes)
             size_info = f"{free_str} free / {total_str}"
         else:
             size_info = ""
 
-        label = f"  {display_name:<36} {size_info:>20}"
-        yield Label(label, classes="drive", id="item-label")
-
-    def on_mount(self) -> None:
-        """Apply colors when mounted."""
-        self._apply_colors()
-
-    def _apply_colors(self) -> None:
-        """Apply colors based on color scheme."""
-        if not self._color_scheme:
-            return
-
-        scheme = self._color_scheme
-        try:
-            label_widget = self.query_one("#item-label", Label)
-            label_widget.styles.color = scheme.directory_fg
-            label_widget.styles.text_style = "bold"
-        except Exception:
-            pass
+        return f"  {display_name:<36} {size_info:>20}"
 
     def _format_size(self, size: int) -> str:
         """Format size in human-readable format."""
@@ -156,23 +266,39 @@ class FileListItem(ListItem):
 
     is_selected: reactive[bool] = reactive(False)
 
-    def __init__(self, path: Path, filename: str, is_dir: bool, size: int,
-                 mtime: float = 0, color_scheme: Optional["ColorScheme"] = None, **kwargs):
+    def __init__(self, path: str | Path, filename: str, is_dir: bool, size: int,
+                 mtime: float = 0, **kwargs):
         super().__init__(**kwargs)
-        self.file_path = path
+        # Listings hand over str paths; the Path is only built when asked for
+        self.path_str = os.fspath(path)
+        self._file_path = path if isinstance(path, Path) else None
         self.filename = filename
         self.is_dir = is_dir
         self.file_size = size
         self.mtime = mtime
-        self._color_scheme = color_scheme
+        self._file_type = self._get_file_type()
+        # Row text parts, formatted once rather than on every selection toggle
+        self._size_str = "<DIR>" if is_dir else self._format_size(size)
+        self._date_str = self._format_date()
+        self._padded_name = filename.ljust(30)[:30]
+        self._padded_date = self._date_str.rjust(16)
+
+    @property
+    def file_path(self) -> Path:
+        """The item's path."""
+        if self._file_path is None:
+            self._file_path = Path(self.path_str)
+        return self._file_path
 
     def _get_file_type(self) -> str:
         """Get the file type for color styling."""
         if self.is_dir:
             return "directory"
-        elif self.filename.lower().endswith((".exe", ".bat", ".cmd", ".ps1", ".com")):
+        dot = self.filename.rfind(".")
+        ext = self.filename[dot:].lower() if dot >= 0 else ""
+        if ext in _EXEC_EXT:
             return "executable"
-        elif self.filename.lower().endswith((".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".arc", ".arj", ".lzh")):
+        elif ext in _ARCHIVE_EXT:
             return "archive"
         else:
             return "file"
@@ -186,69 +312,29 @@ class FileListItem(ListItem):
 
     def compose(self) -> ComposeResult:
         """Compose the file list item - Norton Commander style (no icons)."""
-        if self.is_dir:
-            size_str = "<DIR>"
-        else:
-            size_str = self._format_size(self.file_size)
-
-        date_str = self._format_date()
-
         # Add selection marker
         # Format: marker + name (30 chars) + size (10 chars) + date (16 chars)
         marker = ">" if self.is_selected else " "
-        label = f"{marker} {self.filename:<30} {size_str:>10}  {date_str:>16}"
-        file_type = self._get_file_type()
-        yield Label(label, classes=file_type, id="item-label")
-
-    def on_mount(self) -> None:
-        """Apply colors when item is mounted."""
-        self._apply_colors()
-
-    def _apply_colors(self) -> None:
-        """Apply colors based on file type and color scheme."""
-        if not self._color_scheme:
-            return
-
-        scheme = self._color_scheme
-        file_type = self._get_file_type()
-
-        try:
-            label_widget = self.query_one("#item-label", Label)
+        label = f"{marker} {self._padded_name} {self._size_str:>10}  {self._padded_date}"
+        yield Label(label, classes=self._file_type, id="item-label")
 
-            # Apply color based on file type
-            if file_type == "directory":
-                label_widget.styles.color = scheme.directory_fg
-                label_widget.styles.text_style = "bold"
-            elif file_type == "executable":
-                label_widget.styles.color = scheme.executable_fg
-            elif file_type == "archive":
-                label_widget.styles.color = scheme.archive_fg
-            else:
-                label_widget.styles.color = scheme.panel_fg
-        except Exception:
-            pass
 
     def watch_is_selected(self, new_value: bool) -> None:
         """React to selection changes."""
         if self.is_mounted:
             # Update the label text
             label_widget = self.query_one("#item-label", Label)
-            if self.is_dir:
-                size_str = "<DIR>"
-            else:
-                size_str = self._format_size(self.file_size)
-
-            date_str = self._format_date()
             marker = ">" if new_value else " "
-            label_widget.update(f"{marker} {self.filename:<30} {size_str:>10}  {date_str:>16}")
+            label_widget.update(f"{marker} {self._padded_name} {self._size_str:>10}  {self._padded_date}")
 
-    def _format_size(self, size: int) -> str:
+    @staticmethod
+    def _format_size(size: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:3.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        # Each unit is 2**10 of the last, so the bit length picks it directly
+        unit_idx = max(int(size).bit_length() - 1, 0) // 10
+        if unit_idx >= len(_SIZE_UNITS):
+            return f"{size / (1 << 50):.1f} PB"
+        return f"{size / (1 << (10 * unit_idx)):3.1f} {_SIZE_UNITS[unit_idx]}"
 
 
 class FilePanel(Container):
@@ -256,13 +342,22 @@ class FilePanel(Container):
 
     current_path: reactive[str] = reactive(os.getcwd)
 
+    # Seconds to wait before recounting the selection for the header
+    HEADER_REFRESH_DELAY = 0.15
+
     class PathChanged(Message):
         """Message sent when path changes."""
 
-        def __init__(self, path: str) -> None:
+        def __init__(self, panel: "FilePanel", path: str) -> None:
+            self.panel = panel
             self.path = path
             super().__init__()
 
+        @property
+        def control(self) -> "FilePanel":
+            """The panel whose path changed."""
+            return self.panel
+
     class FileSelected(Message):
         """Message sent when a file is selected."""
 
@@ -274,18 +369,27 @@ class FilePanel(Container):
                  sort_order: str = "name_asc", **kwargs):
         super().__init__(**kwargs)
         self._initial_path = initial_path or os.getcwd()
-        self.selected_files = set()
+        # Selected paths: str key -> the item's Path, built once
+        self.selected_files: dict[str, Path] = {}
         self.show_hidden = show_hidden
         self.sort_order = sort_order
         self._color_scheme: Optional["ColorScheme"] = None
+        # Unfiltered scan results per directory: path -> ((mtime_ns, size), entries)
+        self._dir_cache: "OrderedDict[str, tuple[tuple[int, int], list]]" = OrderedDict()
+        # Scans run on worker threads, so cache updates are locked
+        self._dir_cache_lock = threading.Lock()
+        # Sorted entries of the shown listing, and how many have list items yet
+        self._rows: list = []
+        self._rows_shown = 0
+        # Recursive (files, dirs) counts of selected directories, by (path, mtime_ns)
+        self._count_cache: dict[tuple[str, int], tuple[int, int]] = {}
+        self._header_refresh_timer = None
 
     def set_color_scheme(self, scheme: "ColorScheme") -> None:
-        """Set the color scheme for this panel and refresh items."""
+        """Set the color scheme for this panel."""
         self._color_scheme = scheme
         if self.is_mounted:
             self._apply_panel_colors()
-            # Always refresh the list to rebuild items with new colors
-            self.refresh_file_list()
 
     def _apply_panel_colors(self) -> None:
         """Apply color scheme to panel elements."""
@@ -331,6 +435,7 @@ class FilePanel(Container):
         self.current_path = self._initial_path
         self._apply_panel_colors()
         self.refresh_file_list()
+        self.watch(self.query_one("#file-list", ListView), "scroll_y", self._on_list_scroll, init=False)
 
     def on_focus(self) -> None:
         """Handle focus event."""
@@ -342,7 +447,7 @@ class FilePanel(Container):
             return
         self.refresh_file_list()
         self.update_header()
-        self.post_message(self.PathChanged(new_path))
+        self.post_message(self.PathChanged(self, new_path))
 
     def count_files_in_selection(self) -> tuple[int, int]:
         """Count total files and directories in selection (including subdirectories)."""
@@ -350,23 +455,63 @@ class FilePanel(Container):
         total_dirs = 0
 
         for path_str in self.selected_files:
-            path = Path(path_str)
-            if path.is_dir():
-                total_dirs += 1
-                # Count files in this directory recursively
-                try:
-                    for item in path.rglob("*"):
-                        if item.is_file():
-                            total_files += 1
-                        elif item.is_dir():
-                            total_dirs += 1
-                except (PermissionError, OSError):
-                    pass  # Skip directories we can't access
-            else:
+            try:
+                st = os.stat(path_str)
+            except OSError:
+                total_files += 1
+                continue
+            if not stat.S_ISDIR(st.st_mode):
                 total_files += 1
+                continue
+
+            total_dirs += 1
+            # Reuse the count while the directory itself is unchanged
+            key = (path_str, st.st_mtime_ns)
+            counts = self._count_cache.get(key)
+            if counts is None:
+                counts = self._scan_count(path_str)
+                if len(self._count_cache) >= _COUNT_CACHE_MAX:
+                    self._count_cache.clear()
+                self._count_cache[key] = counts
+            total_files += counts[0]
+            total_dirs += counts[1]
 
         return total_files, total_dirs
 
+    @staticmethod
+    def _scan_count(path_str: str) -> tuple[int, int]:
+        """Count (files, dirs) below a directory, classifying entries from the scan."""
+        files = dirs = 0
+        stack = [path_str]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            continue
+                        if is_dir:
+                            dirs += 1
+                            # Symlinked directories are counted, not descended into
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            files += 1
+            except OSError:
+                pass  # Skip directories we can't access
+        return files, dirs
+
+    def _schedule_header_refresh(self) -> None:
+        """Update the header shortly, once per burst of selection changes."""
+        if self._header_refresh_timer is None:
+            self._header_refresh_timer = self.set_timer(self.HEADER_REFRESH_DELAY, self._do_update_header)
+
+    def _do_update_header(self) -> None:
+        """Run a scheduled header update."""
+        self._header_refresh_timer = None
+        self.update_header()
+
     def update_header(self) -> None:
         """Update the panel header with path and selection info."""
         if not self.is_mounted:
@@ -382,78 +527,199 @@ class FilePanel(Container):
         else:
             header.update(self.current_path)
 
-    def refresh_file_list(self) -> None:
-        """Refresh the file list with proper colors."""
-        file_list = self.query_one("#file-list", ListView)
-        file_list.clear()
+    def set_show_hidden(self, show_hidden: bool) -> None:
+        """Show or hide hidden files, re-filtering the last scan."""
+        self.show_hidden = show_hidden
+        if self.is_mounted:
+            self.refresh_file_list(from_cache=True)
 
-        # Handle "This PC" view - show available drives
-        if self.current_path == THIS_PC:
-            self._show_drives_list(file_list)
-            return
+    def refresh_file_list(self, from_cache: bool = False) -> None:
+        """Refresh the file list with proper colors.
+
+        A cached listing is reused while the directory's mtime and size are
+        unchanged. With from_cache it is reused without even checking them.
+        The directory is read on a worker thread; a newer refresh cancels one
+        still in flight.
+        """
+        self.run_worker(self._refresh_worker(from_cache), group="scan", exclusive=True)
 
+    async def _refresh_worker(self, from_cache: bool) -> None:
+        """Scan the current directory off the UI thread, then show it."""
+        self._apply_scan(await asyncio.to_thread(self._scan_dir, from_cache))
+
+    def _scan_dir(self, from_cache: bool = False) -> tuple:
+        """Read and sort the current directory without touching the widget.
+
+        Safe to run in a worker thread. Returns (path, entries), where
+        entries is None for the drives view and the exception on failure.
+        """
+        path = self.current_path
+        if path == THIS_PC:
+            return path, None
         try:
-            path = Path(self.current_path)
+            listing = self._get_listing(path, from_cache)
+        except Exception as e:
+            return path, e
+        entries = [e[:5] for e in listing if self.show_hidden or not e[5]]
+        return path, self._sort_entries(entries)
+
+    def _apply_scan(self, scan: tuple) -> None:
+        """Fill the file list from a _scan_dir result."""
+        path_str, entries = scan
+        if path_str != self.current_path:
+            # Navigated away during the scan; the new path refreshes itself
+            return
+        file_list = self.query_one("#file-list", ListView)
+        # One screen update for the whole rebuild
+        with self.app.batch_update():
+            file_list.clear()
+            self._rows, self._rows_shown = [], 0
+
+            # Handle "This PC" view - show available drives
+            if entries is None:
+                self.run_worker(self._show_drives_list(file_list), group="drives", exclusive=True)
+                return
 
+            path = Path(path_str)
             # Add parent directory entry or "This PC" for root drives
             if path.parent != path:
-                item = FileListItem(path.parent, "..", True, 0, mtime=0, color_scheme=self._color_scheme)
-                file_list.append(item)
+                items = [FileListItem(path.parent, "..", True, 0, mtime=0)]
             else:
                 # At root of a drive - add ".." to go to "This PC"
-                item = FileListItem(Path(THIS_PC), "..", True, 0, mtime=0, color_scheme=self._color_scheme)
-                file_list.append(item)
+                items = [FileListItem(Path(THIS_PC), "..", True, 0, mtime=0)]
 
-            # Get all entries
-            entries = []
-            try:
-                for entry in path.iterdir():
-                    # Filter hidden files if show_hidden is False
-                    if not self.show_hidden and entry.name.startswith('.'):
-                        continue
-                    # On Windows, also check for hidden attribute
-                    if not self.show_hidden and os.name == 'nt':
-                        try:
-                            import stat as stat_module
-                            if entry.stat().st_file_attributes & stat_module.FILE_ATTRIBUTE_HIDDEN:
-                                continue
-                        except (AttributeError, OSError):
-                            pass
+            if isinstance(entries, Exception):
+                items.append(ListItem(Label(f"Error: {str(entries)}")))
+            else:
+                self._rows = entries
+                items.extend(self._next_row_items())
+            file_list.extend(items)
+
+            # Set focus to first item
+            if file_list.children:
+                file_list.index = 0
+
+    def _next_row_items(self) -> list:
+        """Build list items for the next chunk of rows."""
+        start = self._rows_shown
+        self._rows_shown = min(start + _RENDER_CHUNK, len(self._rows))
+        # Pass color scheme to each item
+        return [
+            FileListItem(entry_path, name, is_dir, size, mtime=mtime)
+            for name, is_dir, size, mtime, entry_path in self._rows[start:self._rows_shown]
+        ]
+
+    def _render_more_rows(self, file_list: ListView) -> None:
+        """Add list items for the next chunk of rows."""
+        file_list.extend(self._next_row_items())
+
+    def _on_list_scroll(self, scroll_y: float) -> None:
+        """Add more rows when the list is scrolled to near its end."""
+        file_list = self.query_one("#file-list", ListView)
+        if self._rows_shown < len(self._rows) and scroll_y >= file_list.max_scroll_y - file_list.size.height:
+            self._render_more_rows(file_list)
 
-                    try:
-                        stat = entry.stat()
-                        entries.append((entry.name, entry.is_dir(), stat.st_size, stat.st_mtime, entry))
-                    except (PermissionError, OSError):
-                        # Skip files we can't access
-                        entries.append((entry.name, entry.is_dir(), 0, 0, entry))
-            except PermissionError:
-                pass
-
-            # Sort entries based on sort_order
-            entries = self._sort_entries(entries)
-
-            # Add items to list - pass color scheme to each item
-            for name, is_dir, size, mtime, entry_path in entries:
-                item = FileListItem(entry_path, name, is_dir, size, mtime=mtime, color_scheme=self._color_scheme)
-                file_list.append(item)
+    def resort_in_memory(self, sort_order: str) -> None:
+        """Change the sort order, re-sorting the cached listing."""
+        self.sort_order = sort_order
+        if self.is_mounted:
+            self.refresh_file_list(from_cache=True)
+
+    def invalidate_listing(self) -> None:
+        """Forget the cached listing of the current directory."""
+        with self._dir_cache_lock:
+            self._dir_cache.pop(self.current_path, None)
+
+    def _get_listing(self, key: str, from_cache: bool) -> list:
+        """Get the unfiltered listing of a directory, scanning only when it changed."""
+        path = Path(key)
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(key)
+        if cached is not None and from_cache:
+            return cached[1]
+        try:
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if cached is not None and cached[0] == stamp:
+            with self._dir_cache_lock:
+                if key in self._dir_cache:
+                    self._dir_cache.move_to_end(key)
+            return cached[1]
+
+        entries = self._scan_directory(path)
+        if stamp is not None:
+            with self._dir_cache_lock:
+                self._dir_cache[key] = (stamp, entries)
+                self._dir_cache.move_to_end(key)
+                if len(self._dir_cache) > _DIR_CACHE_MAX:
+                    self._dir_cache.popitem(last=False)
+        return entries
 
-        except Exception as e:
-            file_list.append(ListItem(Label(f"Error: {str(e)}")))
+    @staticmethod
+    def _scan_directory(path: Path) -> list:
+        """Read a directory into (name, is_dir, size, mtime, path, hidden) tuples.
 
-        # Set focus to first item
-        if file_list.children:
-            file_list.index = 0
+        Paths are kept as str. Each entry costs at most one stat, which
+        DirEntry caches (and on Windows gets for free from the scan).
+        """
+        entries = []
+        is_nt = os.name == 'nt'
+        s_isdir = stat.S_ISDIR
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        # Can't stat it (e.g. broken symlink) - still list it
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        entries.append((name, is_dir, 0, 0, entry.path, name.startswith('.')))
+                        continue
 
-    def _show_drives_list(self, file_list: ListView) -> None:
-        """Show the list of available drives."""
-        drives = get_available_drives()
-        for drive_letter, label, total_bytes, free_bytes in drives:
-            item = DriveListItem(drive_letter, label, total_bytes, free_bytes,
-                               color_scheme=self._color_scheme)
-            file_list.append(item)
+                    hidden = name.startswith('.')
+                    # On Windows, also check for hidden attribute
+                    if not hidden and is_nt:
+                        hidden = bool(st.st_file_attributes & FILE_ATTRIBUTE_HIDDEN)
+                    entries.append((name, s_isdir(st.st_mode), st.st_size, st.st_mtime, entry.path, hidden))
+        except PermissionError:
+            pass
+        return entries
+
+    async def _show_drives_list(self, file_list: ListView) -> None:
+        """Show the list of available drives, probed off the UI thread."""
+        drives = await asyncio.to_thread(get_available_drives)
+        if self.current_path != THIS_PC:
+            return
+        file_list.extend(
+            DriveListItem(drive_letter, label, total_bytes, free_bytes)
+            for drive_letter, label, total_bytes, free_bytes in drives
+        )
         # Set focus to first item
         if file_list.children:
             file_list.index = 0
+        # Fill in labels and sizes as they arrive; the list is usable meanwhile
+        pending = [item for item in file_list.children
+                   if isinstance(item, DriveListItem) and item.details_pending
+                   and not _details_on_demand(item.drive_letter)]
+        if pending:
+            self.run_worker(lambda: self._fill_drive_sizes(pending), thread=True,
+                            group="drive-details", exclusive=True)
+
+    def _fill_drive_sizes(self, items: list[DriveListItem]) -> None:
+        """Read drive details on a worker thread, showing each as it returns."""
+        with ThreadPoolExecutor(max_workers=_DRIVE_PROBE_WORKERS) as executor:
+            futures = {executor.submit(_probe_drive_slow, item.drive_letter): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                details = future.result()
+                _remember_drive_details(item.drive_letter, *details)
+                self.app.call_from_thread(item.set_details, *details)
 
     def _sort_entries(self, entries: list) -> list:
         """Sort entries based on current sort_order.
@@ -463,41 +729,33 @@ class FilePanel(Container):
         """
         sort_key = self.sort_order.rsplit("_", 1)[0]  # e.g., "name", "size", "date", "ext"
         reverse = self.sort_order.endswith("_desc")
-
-        if sort_key == "name":
-            # Sort by name (case-insensitive)
-            entries.sort(key=lambda x: (not x[1], x[0].lower()), reverse=False)
-            if reverse:
-                # Reverse only within dirs and files separately
-                dirs = [e for e in entries if e[1]]
-                files = [e for e in entries if not e[1]]
-                dirs.sort(key=lambda x: x[0].lower(), reverse=True)
-                files.sort(key=lambda x: x[0].lower(), reverse=True)
-                entries = dirs + files
-        elif sort_key == "size":
-            # Sort by size
-            entries.sort(key=lambda x: (not x[1], x[2] if not reverse else -x[2]))
-        elif sort_key == "date":
-            # Sort by modification date (mtime is now at index 3)
-            entries.sort(key=lambda x: (not x[1], x[3] if not reverse else -x[3]))
-        elif sort_key == "ext":
-            # Sort by extension
-            def get_ext(name):
-                if '.' in name:
-                    return name.rsplit('.', 1)[-1].lower()
-                return ""
-            entries.sort(key=lambda x: (not x[1], get_ext(x[0])), reverse=False)
-            if reverse:
-                dirs = [e for e in entries if e[1]]
-                files = [e for e in entries if not e[1]]
-                dirs.sort(key=lambda x: get_ext(x[0]), reverse=True)
-                files.sort(key=lambda x: get_ext(x[0]), reverse=True)
-                entries = dirs + files
-        else:
+        column = _SORT_COLUMNS.get(sort_key)
+        if column is None:
             # Default: dirs first, then by name
-            entries.sort(key=lambda x: (not x[1], x[0].lower()))
+            column, reverse = _SORT_COLUMNS["name"], False
 
-        return entries
+        # Compute each key once, then sort on (group, key). The group flag is
+        # flipped for descending order so directories still come first.
+        if reverse:
+            decorated = [(e[1], column(e), e) for e in entries]
+        else:
+            decorated = [(not e[1], column(e), e) for e in entries]
+        decorated.sort(key=itemgetter(0, 1), reverse=reverse)
+        return [d[2] for d in decorated]
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Add rows as the cursor nears the end; read drive details on demand."""
+        file_list = event.list_view
+        if (self._rows_shown < len(self._rows) and file_list.index is not None
+                and file_list.index >= len(file_list.children) - _RENDER_CHUNK // 4):
+            self._render_more_rows(file_list)
+
+        # Read a drive's details once the user moves onto it
+        item = event.item
+        if (isinstance(item, DriveListItem) and item.details_pending
+                and _details_on_demand(item.drive_letter)):
+            item.details_pending = False
+            self.run_worker(lambda: self._fill_drive_sizes([item]), thread=True)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle file selection."""
@@ -507,10 +765,10 @@ class FilePanel(Container):
         elif isinstance(event.item, FileListItem):
             if event.item.is_dir:
                 # Check if this is the ".." item pointing to "This PC"
-                if event.item.filename == ".." and str(event.item.file_path) == THIS_PC:
+                if event.item.filename == ".." and event.item.path_str == THIS_PC:
                     self.current_path = THIS_PC
                 else:
-                    self.current_path = str(event.item.file_path)
+                    self.current_path = event.item.path_str
             else:
                 self.post_message(self.FileSelected(event.item.file_path))
 
@@ -540,7 +798,7 @@ class FilePanel(Container):
         """Get the currently focused item."""
         file_list = self.query_one("#file-list", ListView)
         if file_list.index is not None and file_list.index < len(file_list.children):
-            item = list(file_list.children)[file_list.index]
+            item = file_list.children[file_list.index]
             if isinstance(item, FileListItem):
                 return item
         return None
@@ -549,18 +807,18 @@ class FilePanel(Container):
         """Toggle selection of the currently focused item."""
         item = self.get_focused_item()
         if item and item.filename != "..":
-            item_path = str(item.file_path)
+            item_path = item.path_str
             if item_path in self.selected_files:
-                self.selected_files.remove(item_path)
+                del self.selected_files[item_path]
                 item.is_selected = False
                 item.remove_class("-selected")
             else:
-                self.selected_files.add(item_path)
+                self.selected_files[item_path] = item.file_path
                 item.is_selected = True
                 item.add_class("-selected")
 
             # Update selection counter in header
-            self.update_header()
+            self._schedule_header_refresh()
 
             # Move to next item
             file_list = self.query_one("#file-list", ListView)
@@ -575,11 +833,27 @@ class FilePanel(Container):
                 child.is_selected = False
                 child.remove_class("-selected")
         self.selected_files.clear()
-        self.update_header()
+        self._schedule_header_refresh()
 
     def get_selected_items(self) -> list[Path]:
         """Get list of selected file paths."""
-        return [Path(p) for p in self.selected_files]
+        return list(self.selected_files.values())
+
+    def get_selected_entries(self) -> list[tuple[Path, bool]]:
+        """Get (path, is_dir) for each selected item.
+
+        The type comes from the listed items, so only selections no longer
+        shown in the panel need a stat.
+        """
+        remaining = dict(self.selected_files)
+        entries = []
+        for child in self.query_one("#file-list", ListView).children:
+            if isinstance(child, FileListItem):
+                path = remaining.pop(child.path_str, None)
+                if path is not None:
+                    entries.append((path, child.is_dir))
+        entries.extend((path, os.path.isdir(path)) for path in remaining.values())
+        return entries
 
     def on_key(self, event) -> None:
         """Handle key presses."""
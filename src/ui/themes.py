@@ -1,7 +1,8 @@
 """Theme system for Mo Commander with customizable color schemes."""
 
+import functools
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 from textual.theme import Theme
 
 
@@ -129,6 +130,15 @@ def create_textual_theme(name: str, scheme: ColorScheme) -> Theme:
             "block-cursor-blurred-background": scheme.selected_bg,
             "block-cursor-blurred-foreground": scheme.selected_fg,
             "block-cursor-blurred-text-style": "none",
+            # Header and copyright text (referenced from the app CSS)
+            "mc-header-background": scheme.header_bg,
+            "mc-header-foreground": scheme.header_fg,
+            "mc-copyright-background": scheme.footer_bg,
+            "mc-copyright-foreground": scheme.cursor_bg,
+            # List item text, by file type (referenced from the app CSS)
+            "mc-directory-foreground": scheme.directory_fg,
+            "mc-executable-foreground": scheme.executable_fg,
+            "mc-archive-foreground": scheme.archive_fg,
             # Footer styling
             "footer-background": scheme.footer_bg,
             "footer-key-foreground": scheme.cursor_bg,
@@ -143,11 +153,10 @@ def create_textual_theme(name: str, scheme: ColorScheme) -> Theme:
     )
 
 
-# Create Textual themes from our schemes
-MC_TEXTUAL_THEMES: Dict[str, Theme] = {
-    name: create_textual_theme(name, scheme)
-    for name, scheme in MC_SCHEMES.items()
-}
+@functools.cache
+def get_textual_theme(name: str) -> Theme:
+    """Get the Textual theme for a scheme name, creating it on first use."""
+    return create_textual_theme(name, MC_SCHEMES[name])
 
 
 class ThemeManager:
@@ -174,9 +183,9 @@ class ThemeManager:
         """Get the current color scheme."""
         return self.THEMES[self._current_theme]
 
-    def get_textual_theme(self) -> Theme:
-        """Get the current Textual theme."""
-        return MC_TEXTUAL_THEMES[self._current_theme]
+    def get_textual_theme(self, theme_name: Optional[str] = None) -> Theme:
+        """Get the Textual theme for theme_name (default: the current theme)."""
+        return get_textual_theme(theme_name or self._current_theme)
 
     def get_textual_theme_name(self) -> str:
         """Get the Textual theme name for the current theme."""
@@ -189,4 +198,4 @@ class ThemeManager:
     @staticmethod
     def get_all_textual_themes() -> Dict[str, Theme]:
         """Get all Textual themes for registration."""
-        return MC_TEXTUAL_THEMES
+        return {name: get_textual_theme(name) for name in MC_SCHEMES}